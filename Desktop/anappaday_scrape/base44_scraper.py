@@ -17,60 +17,73 @@ class Base44Scraper:
         self.base_url = "https://catalog.base44.com/apps"
         self.apps_data = []
         
-    async def scrape_all_apps(self):
+    async def scrape_all_apps(self, browser=None):
         """Main scraping function that handles numbered pagination"""
+        # A browser passed in (e.g. the weekly run's shared one) is left open
+        if browser is not None:
+            await self._scrape_with_browser(browser)
+            return
+        
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
             try:
-                print(f"Starting to scrape {self.base_url}")
+                await self._scrape_with_browser(browser)
+            finally:
+                await browser.close()
+    
+    async def _scrape_with_browser(self, browser):
+        """Scrape using a fresh context of the given browser"""
+        context = await browser.new_context()
+        page = await context.new_page()
+        
+        try:
+            print(f"Starting to scrape {self.base_url}")
+            
+            # Start with page 1
+            current_page = 1
+            has_more_pages = True
+            
+            while has_more_pages:
+                page_url = f"{self.base_url}?page={current_page}" if current_page > 1 else self.base_url
+                print(f"Scraping page {current_page}: {page_url}")
                 
-                # Start with page 1
-                current_page = 1
-                has_more_pages = True
+                await page.goto(page_url, wait_until="networkidle")
+                await page.wait_for_timeout(3000)
                 
-                while has_more_pages:
-                    page_url = f"{self.base_url}?page={current_page}" if current_page > 1 else self.base_url
-                    print(f"Scraping page {current_page}: {page_url}")
-                    
-                    await page.goto(page_url, wait_until="networkidle")
-                    await page.wait_for_timeout(3000)
-                    
-                    # Extract apps from current page
-                    apps_on_page = await self.extract_apps_from_page(page)
-                    
-                    if apps_on_page:
-                        # Add page number to each app
-                        for app in apps_on_page:
-                            app['page_number'] = current_page
-                        
-                        self.apps_data.extend(apps_on_page)
-                        print(f"Found {len(apps_on_page)} apps on page {current_page}")
-                    else:
-                        print(f"No apps found on page {current_page}")
-                        has_more_pages = False
-                        break
-                    
-                    # Check if there's a next page
-                    has_more_pages = await self.has_next_page(page, current_page)
-                    
-                    if has_more_pages:
-                        current_page += 1
-                        await page.wait_for_timeout(2000)  # Be respectful
-                    else:
-                        print("No more pages to scrape")
-                        break
+                # Extract apps from current page
+                apps_on_page = await self.extract_apps_from_page(page)
                 
-                print(f"\nScraping completed! Total apps found: {len(self.apps_data)}")
+                if apps_on_page:
+                    # Add page number to each app
+                    for app in apps_on_page:
+                        app['page_number'] = current_page
+                    
+                    self.apps_data.extend(apps_on_page)
+                    print(f"Found {len(apps_on_page)} apps on page {current_page}")
+                else:
+                    print(f"No apps found on page {current_page}")
+                    has_more_pages = False
+                    break
                 
-            except Exception as e:
-                print(f"Error during scraping: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                # Check if there's a next page
+                has_more_pages = await self.has_next_page(page, current_page)
                 
-            finally:
-                await browser.close()
+                if has_more_pages:
+                    current_page += 1
+                    await page.wait_for_timeout(2000)  # Be respectful
+                else:
+                    print("No more pages to scrape")
+                    break
+            
+            print(f"\nScraping completed! Total apps found: {len(self.apps_data)}")
+            
+        except Exception as e:
+            print(f"Error during scraping: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            
+        finally:
+            await context.close()
     
     async def extract_apps_from_page(self, page) -> List[Dict[str, Any]]:
         """Extract app data from current page"""
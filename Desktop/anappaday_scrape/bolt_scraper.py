@@ -8,6 +8,7 @@ import asyncio
 import json
 import time
 from playwright.async_api import async_playwright
+from browser_pool import HIDE_WEBDRIVER_JS
 from bs4 import BeautifulSoup
 from typing import List, Dict, Any
 import re
@@ -17,8 +18,13 @@ class BoltGalleryScraper:
         self.base_url = "https://bolt.new/gallery/all"
         self.projects_data = []
         
-    async def scrape_all_projects(self):
+    async def scrape_all_projects(self, browser=None):
         """Main scraping function for Bolt.new Gallery"""
+        # A browser passed in (e.g. the weekly run's shared one) is left open
+        if browser is not None:
+            await self._scrape_with_browser(browser)
+            return
+        
         async with async_playwright() as p:
             browser = await p.chromium.launch(
                 headless=True,
@@ -29,43 +35,50 @@ class BoltGalleryScraper:
                     '--disable-web-security'
                 ]
             )
-            
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            page = await context.new_page()
-            
             try:
-                print(f"Navigating to {self.base_url}")
-                
-                await page.goto(self.base_url, wait_until="networkidle", timeout=30000)
-                print("Page loaded successfully, waiting for content...")
-                
-                await page.wait_for_timeout(5000)
-                
-                # Handle load more pagination
-                await self.handle_load_more_pagination(page)
-                
-                # Extract projects from the page
-                await self.extract_projects_from_page(page)
-                
-                print(f"\nScraping completed! Total projects found: {len(self.projects_data)}")
-                
-            except Exception as e:
-                print(f"Error during scraping: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                
-                # Save partial data if any was collected
-                if self.projects_data:
-                    print(f"Saving partial data ({len(self.projects_data)} projects)...")
-                    self.save_to_json('bolt_projects_partial.json')
-                
+                await self._scrape_with_browser(browser)
             finally:
                 await browser.close()
     
+    async def _scrape_with_browser(self, browser):
+        """Scrape using a fresh context of the given browser"""
+        context = await browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        )
+        await context.add_init_script(HIDE_WEBDRIVER_JS)
+        
+        page = await context.new_page()
+        
+        try:
+            print(f"Navigating to {self.base_url}")
+            
+            await page.goto(self.base_url, wait_until="networkidle", timeout=30000)
+            print("Page loaded successfully, waiting for content...")
+            
+            await page.wait_for_timeout(5000)
+            
+            # Handle load more pagination
+            await self.handle_load_more_pagination(page)
+            
+            # Extract projects from the page
+            await self.extract_projects_from_page(page)
+            
+            print(f"\nScraping completed! Total projects found: {len(self.projects_data)}")
+            
+        except Exception as e:
+            print(f"Error during scraping: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            
+            # Save partial data if any was collected
+            if self.projects_data:
+                print(f"Saving partial data ({len(self.projects_data)} projects)...")
+                self.save_to_json('bolt_projects_partial.json')
+            
+        finally:
+            await context.close()
+    
     async def handle_load_more_pagination(self, page):
         """Handle load more button clicking"""
         try:
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Shared Chromium instance for the site scrapers
+"""
+
+import asyncio
+from playwright.async_api import async_playwright
+
+# Chromium flags shared by every site: the scrapers only need the DOM, so
+# switch off the subsystems (GPU, extensions, sync, background work, audio)
+# that cost memory or spawn helper processes.  Nothing here weakens the
+# sandbox or same-origin checks, since all sites share the browser.
+CHROMIUM_ARGS = [
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-default-apps',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-breakpad',
+    '--disable-renderer-backgrounding',
+    '--disable-sync',
+    '--disable-translate',
+    '--mute-audio',
+    '--disable-ipc-flooding-protection'
+]
+
+# Per-context stand-in for --disable-blink-features=AutomationControlled, for
+# sites that should not see navigator.webdriver
+HIDE_WEBDRIVER_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+class BrowserPool:
+    """Process-wide Chromium instance reused across scrape runs.
+
+    Launching Chromium costs hundreds of milliseconds and a fresh set of
+    helper processes, so the browser is started once and only contexts are
+    created and closed per run.  Playwright objects are bound to the event
+    loop that created them, so a run on a different loop gets a new browser.
+    """
+    _playwright = None
+    _browser = None
+    _loop = None
+    _lock = None
+
+    @classmethod
+    async def init(cls):
+        """Launch the shared browser ahead of the first scrape"""
+        await cls.get_browser()
+
+    @classmethod
+    async def get_browser(cls):
+        """Return the shared browser, launching it on first use"""
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            cls._playwright = None
+            cls._browser = None
+            cls._loop = loop
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            if cls._browser is None or not cls._browser.is_connected():
+                if cls._playwright is None:
+                    cls._playwright = await async_playwright().start()
+                cls._browser = await cls._playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        return cls._browser
+
+    @classmethod
+    async def close(cls):
+        """Shut down the shared browser (call once, when the process is done scraping)"""
+        if cls._loop is asyncio.get_running_loop():
+            if cls._browser is not None:
+                await cls._browser.close()
+            if cls._playwright is not None:
+                await cls._playwright.stop()
+        cls._playwright = None
+        cls._browser = None
+        cls._loop = None
+        cls._lock = None
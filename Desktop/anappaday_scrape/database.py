@@ -4,20 +4,112 @@ Database system for tracking scraped items and managing deduplication
 """
 
 import sqlite3
-import json
+import orjson
 import hashlib
+from contextlib import contextmanager
+from itertools import groupby
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterator
 import os
 
+# Item fields stored in their own columns; everything else goes into metadata
+COLUMN_FIELDS = ['title', 'name', 'url', 'app_url', 'author', 'creator', 'description', 'image_url', 'logo_url']
+
+# Hashes per IN (...) lookup; well under SQLite's bound-parameter limit
+HASH_LOOKUP_CHUNK = 500
+# Rows per executemany call when saving items
+UPSERT_CHUNK = 1000
+
+# Insert a new item or refresh an existing one (matched on item_hash)
+UPSERT_ITEM_SQL = """
+    INSERT INTO items (
+        site_id, item_hash, title, url, author, description,
+        image_url, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(item_hash) DO UPDATE SET
+        last_seen = CURRENT_TIMESTAMP,
+        title = excluded.title,
+        url = excluded.url,
+        author = excluded.author,
+        description = excluded.description,
+        image_url = excluded.image_url,
+        metadata = excluded.metadata
+"""
+
+# Refresh a cached scrape; the items blob is only rewritten when its hash changed
+UPSERT_CACHE_SQL = """
+    INSERT INTO scrape_cache (url, content_hash, items, ttl) VALUES (?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        fetched_at = CURRENT_TIMESTAMP,
+        ttl = excluded.ttl,
+        items = CASE WHEN content_hash = excluded.content_hash
+                     THEN items ELSE excluded.items END,
+        content_hash = excluded.content_hash
+"""
+
+class ConnectionPool:
+    """Cached SQLite connections: one writer and one read-only reader.
+    
+    Every database call runs on the event-loop thread, so one connection of
+    each kind is enough.  Under WAL the reader sees the last committed state
+    without waiting on the writer.
+    """
+    
+    def __init__(self, connect: Callable[..., sqlite3.Connection]):
+        self._connect = connect
+        self._reader = None
+        self._writer = None
+    
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the read-only connection"""
+        if self._reader is None:
+            self._reader = self._connect(read_only=True)
+        yield self._reader
+    
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the writer for one transaction, committed on success"""
+        if self._writer is None:
+            self._writer = self._connect()
+        with self._writer:
+            yield self._writer
+    
+    def close(self):
+        """Close the cached connections"""
+        for conn in (self._reader, self._writer):
+            if conn is not None:
+                conn.close()
+        self._reader = None
+        self._writer = None
+
 class ScrapingDatabase:
     def __init__(self, db_path: str = "scraping_history.db"):
         self.db_path = db_path
         self.init_database()
+        self.pool = ConnectionPool(self._connect)
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a connection with the per-connection PRAGMAs applied"""
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL (set once in init_database) makes NORMAL sync crash-safe and
+        # skips an fsync per commit; wait for a busy writer instead of failing
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        return conn
     
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
+        # journal_mode is persistent, so it only needs setting once
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
         
         # Create sites table
@@ -65,28 +157,68 @@ class ScrapingDatabase:
             )
         """)
         
-        # Create indexes
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_item_hash ON items (item_hash)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_site_id ON items (site_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_first_seen ON items (first_seen)")
+        # Create scrape_cache table (last parsed items per site URL)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_cache (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                items TEXT NOT NULL,
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                ttl INTEGER NOT NULL
+            )
+        """)
         
-        conn.commit()
-        conn.close()
-    
-    def register_site(self, name: str, url: str) -> int:
-        """Register a site for tracking"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Create runs_summary table (one row per weekly run of all scrapers)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS runs_summary (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started TIMESTAMP,
+                finished TIMESTAMP,
+                duration_seconds REAL,
+                total_new INTEGER,
+                summary TEXT
+            )
+        """)
         
+        # Create run_items table (per-scraper outcome of a weekly run)
         cursor.execute("""
-            INSERT OR IGNORE INTO sites (name, url) VALUES (?, ?)
-        """, (name, url))
+            CREATE TABLE IF NOT EXISTS run_items (
+                run_id INTEGER,
+                scraper TEXT,
+                site TEXT,
+                success BOOLEAN,
+                total_items INTEGER,
+                new_items INTEGER,
+                error_message TEXT,
+                FOREIGN KEY (run_id) REFERENCES runs_summary (id)
+            )
+        """)
         
-        cursor.execute("SELECT id FROM sites WHERE name = ?", (name,))
-        site_id = cursor.fetchone()[0]
+        # Create indexes (item_hash lookups use its UNIQUE constraint's index)
+        cursor.execute("DROP INDEX IF EXISTS idx_item_hash")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_first_seen ON items (first_seen)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_site_first_seen ON items (site_id, first_seen)")
+        # site_id lookups use the leading column of idx_site_first_seen
+        cursor.execute("DROP INDEX IF EXISTS idx_site_id")
         
         conn.commit()
         conn.close()
+    
+    def close(self):
+        """Close the pooled connections"""
+        self.pool.close()
+    
+    def register_site(self, name: str, url: str) -> int:
+        """Register a site for tracking"""
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                INSERT OR IGNORE INTO sites (name, url) VALUES (?, ?)
+            """, (name, url))
+            
+            cursor.execute("SELECT id FROM sites WHERE name = ?", (name,))
+            site_id = cursor.fetchone()[0]
         return site_id
     
     def generate_item_hash(self, item: Dict[str, Any]) -> str:
@@ -108,41 +240,76 @@ class ScrapingDatabase:
     
     def find_new_items(self, site_name: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Find items that are new since last scraping"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Get site ID
-        cursor.execute("SELECT id FROM sites WHERE name = ?", (site_name,))
-        result = cursor.fetchone()
-        if not result:
-            conn.close()
-            return items  # All items are new if site not registered
-        
-        site_id = result[0]
-        
-        # Get existing item hashes
-        cursor.execute("SELECT item_hash FROM items WHERE site_id = ? AND is_active = 1", (site_id,))
-        existing_hashes = {row[0] for row in cursor.fetchall()}
-        
-        conn.close()
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            
+            # Get site ID
+            cursor.execute("SELECT id FROM sites WHERE name = ?", (site_name,))
+            result = cursor.fetchone()
+            if not result:
+                return items  # All items are new if site not registered
+            
+            site_id = result[0]
+            
+            # Look up only this batch's hashes (via the item_hash index)
+            hashes = [self.generate_item_hash(item) for item in items]
+            known = self._lookup_hashes(cursor, hashes)
+            existing_hashes = {h for h, (item_site, active) in known.items() if item_site == site_id and active}
         
         # Filter for new items
         new_items = []
-        for item in items:
-            item_hash = self.generate_item_hash(item)
+        for item, item_hash in zip(items, hashes):
             if item_hash not in existing_hashes:
                 item['_hash'] = item_hash  # Add hash for later use
                 new_items.append(item)
         
         return new_items
     
+    def _lookup_hashes(self, cursor: sqlite3.Cursor, hashes: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Map each stored hash among `hashes` to its (site_id, is_active)"""
+        unique = list(dict.fromkeys(hashes))
+        found = {}
+        for i in range(0, len(unique), HASH_LOOKUP_CHUNK):
+            chunk = unique[i:i + HASH_LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(
+                f"SELECT item_hash, site_id, is_active FROM items WHERE item_hash IN ({placeholders})",
+                chunk
+            )
+            for item_hash, site_id, is_active in cursor:
+                found[item_hash] = (site_id, is_active)
+        return found
+    
     def save_scraping_results(self, site_name: str, items: List[Dict[str, Any]]) -> Dict[str, int]:
         """Save scraping results and return statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Ensure site is registered
-        site_id = self.register_site(site_name, "")
+        return self.save_scraping_results_bulk(site_name, items)
+    
+    def _item_row(self, site_id: int, item_hash: str, item: Dict[str, Any]) -> Tuple:
+        """Build the UPSERT_ITEM_SQL parameters for an item"""
+        return (
+            site_id,
+            item_hash,
+            item.get('title') or item.get('name'),
+            item.get('url') or item.get('app_url'),
+            item.get('author') or item.get('creator'),
+            item.get('description'),
+            item.get('image_url') or item.get('logo_url'),
+            orjson.dumps(
+                {k: v for k, v in item.items() if k not in COLUMN_FIELDS},
+                option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        )
+    
+    def _write_items(self, cursor: sqlite3.Cursor, site_name: str, items: List[Dict[str, Any]],
+                     existing_hashes: set) -> Dict[str, int]:
+        """Upsert items and record the run using an open cursor (no commit).
+        
+        existing_hashes holds every item_hash already in the table; it is
+        updated in place as items are written.
+        """
+        cursor.execute("INSERT OR IGNORE INTO sites (name, url) VALUES (?, ?)", (site_name, ""))
+        cursor.execute("SELECT id FROM sites WHERE name = ?", (site_name,))
+        site_id = cursor.fetchone()[0]
         
         # Update site last_scraped timestamp
         cursor.execute("""
@@ -150,57 +317,18 @@ class ScrapingDatabase:
             WHERE id = ?
         """, (len(items), site_id))
         
-        # Process each item
+        # One prepared statement, fed in slices to bound memory per call
         new_items = 0
-        updated_items = 0
-        
-        for item in items:
-            item_hash = item.get('_hash') or self.generate_item_hash(item)
-            
-            # Check if item exists
-            cursor.execute("SELECT id, last_seen FROM items WHERE item_hash = ?", (item_hash,))
-            existing = cursor.fetchone()
-            
-            if existing:
-                # Update existing item
-                cursor.execute("""
-                    UPDATE items SET 
-                        last_seen = CURRENT_TIMESTAMP,
-                        title = ?,
-                        url = ?,
-                        author = ?,
-                        description = ?,
-                        image_url = ?,
-                        metadata = ?
-                    WHERE item_hash = ?
-                """, (
-                    item.get('title') or item.get('name'),
-                    item.get('url') or item.get('app_url'),
-                    item.get('author') or item.get('creator'),
-                    item.get('description'),
-                    item.get('image_url') or item.get('logo_url'),
-                    json.dumps({k: v for k, v in item.items() if k not in ['title', 'name', 'url', 'app_url', 'author', 'creator', 'description', 'image_url', 'logo_url']}),
-                    item_hash
-                ))
-                updated_items += 1
-            else:
-                # Insert new item
-                cursor.execute("""
-                    INSERT INTO items (
-                        site_id, item_hash, title, url, author, description, 
-                        image_url, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    site_id,
-                    item_hash,
-                    item.get('title') or item.get('name'),
-                    item.get('url') or item.get('app_url'),
-                    item.get('author') or item.get('creator'),
-                    item.get('description'),
-                    item.get('image_url') or item.get('logo_url'),
-                    json.dumps({k: v for k, v in item.items() if k not in ['title', 'name', 'url', 'app_url', 'author', 'creator', 'description', 'image_url', 'logo_url']})
-                ))
-                new_items += 1
+        for start in range(0, len(items), UPSERT_CHUNK):
+            rows = []
+            for item in items[start:start + UPSERT_CHUNK]:
+                item_hash = item.get('_hash') or self.generate_item_hash(item)
+                if item_hash not in existing_hashes:
+                    existing_hashes.add(item_hash)
+                    new_items += 1
+                rows.append(self._item_row(site_id, item_hash, item))
+            cursor.executemany(UPSERT_ITEM_SQL, rows)
+        updated_items = len(items) - new_items
         
         # Record scraping run
         cursor.execute("""
@@ -209,103 +337,243 @@ class ScrapingDatabase:
             ) VALUES (?, ?, ?, ?, 'success')
         """, (site_id, len(items), new_items, updated_items))
         
-        conn.commit()
-        conn.close()
-        
         return {
             'total_items': len(items),
             'new_items': new_items,
             'updated_items': updated_items
         }
     
+    def save_scraping_results_bulk(self, site_name: str, items: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Save scraping results with a single executemany in one transaction"""
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            hashes = [item.get('_hash') or self.generate_item_hash(item) for item in items]
+            existing_hashes = set(self._lookup_hashes(cursor, hashes))
+            stats = self._write_items(cursor, site_name, items, existing_hashes)
+        return stats
+    
+    def find_and_save_new(self, site_name: str, items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Find items new to a site and save all results in one transaction.
+        
+        Equivalent to find_new_items() followed by save_scraping_results(),
+        but the existing hashes are read once and every write shares a
+        single commit. Returns (new_items, stats).
+        """
+        with self.pool.writer() as conn:
+            cursor = conn.cursor()
+            # Look up only this batch's hashes (via the item_hash index)
+            hashes = [self.generate_item_hash(item) for item in items]
+            known = self._lookup_hashes(cursor, hashes)
+            existing_hashes = set(known)
+            
+            cursor.execute("SELECT id FROM sites WHERE name = ?", (site_name,))
+            result = cursor.fetchone()
+            if result is None:
+                new_items = items  # All items are new if site not registered
+            else:
+                site_id = result[0]
+                new_items = []
+                for item, item_hash in zip(items, hashes):
+                    item_site, active = known.get(item_hash, (None, 0))
+                    if item_site != site_id or not active:
+                        item['_hash'] = item_hash  # Add hash for later use
+                        new_items.append(item)
+            
+            stats = self._write_items(cursor, site_name, items, existing_hashes)
+        return new_items, stats
+    
+    def get_cached_items(self, url: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached items for a URL if they are still within their TTL"""
+        with self.pool.reader() as conn:
+            row = conn.execute("""
+                SELECT items FROM scrape_cache
+                WHERE url = ?
+                  AND strftime('%s', 'now') - strftime('%s', fetched_at) < ttl
+            """, (url,)).fetchone()
+        return orjson.loads(row[0]) if row else None
+    
+    def cache_items(self, url: str, items: List[Dict[str, Any]], ttl: int) -> bool:
+        """Cache the parsed items for a URL; returns True if the content changed"""
+        blob = orjson.dumps(items, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        content_hash = hashlib.blake2b(blob, digest_size=16).hexdigest()
+        blob = blob.decode()
+        
+        with self.pool.writer() as conn:
+            row = conn.execute(
+                "SELECT content_hash FROM scrape_cache WHERE url = ?", (url,)
+            ).fetchone()
+            conn.execute(UPSERT_CACHE_SQL, (url, content_hash, blob, ttl))
+        return row is None or row[0] != content_hash
+    
+    def save_run_summary(self, summary: Dict[str, Any], started: str, finished: str,
+                         summary_json: Optional[str] = None) -> int:
+        """Store a weekly run summary and its per-scraper results; returns the run id.
+        
+        summary_json may carry the summary already serialized, so it is not
+        encoded a second time.
+        """
+        if summary_json is None:
+            summary_json = orjson.dumps(summary, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        with self.pool.writer() as conn:
+            cursor = conn.execute("""
+                INSERT INTO runs_summary (started, finished, duration_seconds, total_new, summary)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                started,
+                finished,
+                summary.get('duration_seconds'),
+                summary.get('total_new_items'),
+                summary_json
+            ))
+            run_id = cursor.lastrowid
+            conn.executemany("""
+                INSERT INTO run_items (run_id, scraper, site, success, total_items, new_items, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (run_id, key, result.get('site'), bool(result.get('success')),
+                 result.get('total_items'), result.get('new_items'), result.get('error'))
+                for key, result in summary.get('scrapers', {}).items()
+            ])
+        return run_id
+    
     def get_new_items_since(self, site_name: str, days: int = 7) -> List[Dict[str, Any]]:
         """Get items that are new within the specified number of days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT i.title, i.url, i.author, i.description, i.image_url, 
-                   i.metadata, i.first_seen
-            FROM items i
-            JOIN sites s ON i.site_id = s.id
-            WHERE s.name = ? 
-            AND i.first_seen >= datetime('now', '-{} days')
-            AND i.is_active = 1
-            ORDER BY i.first_seen DESC
-        """.format(days), (site_name,))
-        
-        results = []
-        for row in cursor.fetchall():
-            item = {
-                'title': row[0],
-                'url': row[1],
-                'author': row[2],
-                'description': row[3],
-                'image_url': row[4],
-                'first_seen': row[6]
-            }
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
             
-            # Add metadata
-            if row[5]:
-                try:
-                    metadata = json.loads(row[5])
-                    item.update(metadata)
-                except:
-                    pass
+            cursor.execute("""
+                SELECT i.title, i.url, i.author, i.description, i.image_url, 
+                       i.metadata, i.first_seen
+                FROM items i
+                JOIN sites s ON i.site_id = s.id
+                WHERE s.name = ? 
+                AND i.first_seen >= datetime('now', '-{} days')
+                AND i.is_active = 1
+                ORDER BY i.first_seen DESC
+            """.format(days), (site_name,))
             
-            results.append(item)
-        
-        conn.close()
+            results = [self._new_item_from_row(row) for row in cursor.fetchall()]
         return results
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get overall statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def get_new_items_by_site(self, site_names: List[str], days: int = 7) -> Dict[str, List[Dict[str, Any]]]:
+        """Get items new within `days` for several sites in one query.
         
-        # Site statistics
-        cursor.execute("""
-            SELECT s.name, s.url, s.last_scraped, s.total_items,
-                   COUNT(i.id) as tracked_items,
-                   COUNT(CASE WHEN i.first_seen >= datetime('now', '-7 days') THEN 1 END) as new_this_week
-            FROM sites s
-            LEFT JOIN items i ON s.id = i.site_id AND i.is_active = 1
-            GROUP BY s.id, s.name, s.url, s.last_scraped, s.total_items
-        """)
-        
-        sites = []
-        for row in cursor.fetchall():
-            sites.append({
-                'name': row[0],
-                'url': row[1],
-                'last_scraped': row[2],
-                'total_items': row[3],
-                'tracked_items': row[4],
-                'new_this_week': row[5]
-            })
+        Sites without new items are left out; the rest keep the order of
+        site_names.
+        """
+        if not site_names:
+            return {}
         
-        # Recent runs
-        cursor.execute("""
-            SELECT s.name, r.run_timestamp, r.items_found, r.new_items, r.status
-            FROM scraping_runs r
-            JOIN sites s ON r.site_id = s.id
-            ORDER BY r.run_timestamp DESC
-            LIMIT 10
-        """)
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            
+            placeholders = ','.join('?' * len(site_names))
+            cursor.execute(f"""
+                SELECT i.title, i.url, i.author, i.description, i.image_url, 
+                       i.metadata, i.first_seen, s.name
+                FROM items i
+                JOIN sites s ON i.site_id = s.id
+                WHERE s.name IN ({placeholders})
+                AND i.first_seen >= datetime('now', ?)
+                AND i.is_active = 1
+                ORDER BY s.name, i.first_seen DESC
+            """, (*site_names, f'-{days} days'))
+            
+            by_site = {
+                site_name: [self._new_item_from_row(row) for row in rows]
+                for site_name, rows in groupby(cursor, key=lambda row: row[7])
+            }
+        return {name: by_site[name] for name in site_names if name in by_site}
+    
+    def _new_item_from_row(self, row: Tuple) -> Dict[str, Any]:
+        """Build a new-item dict from a (title, url, author, description,
+        image_url, metadata, first_seen, ...) row"""
+        item = {
+            'title': row[0],
+            'url': row[1],
+            'author': row[2],
+            'description': row[3],
+            'image_url': row[4],
+            'first_seen': row[6]
+        }
         
-        recent_runs = []
-        for row in cursor.fetchall():
-            recent_runs.append({
-                'site': row[0],
-                'timestamp': row[1],
-                'items_found': row[2],
-                'new_items': row[3],
-                'status': row[4]
-            })
+        # Add metadata
+        if row[5]:
+            try:
+                metadata = orjson.loads(row[5])
+                item.update(metadata)
+            except:
+                pass
         
-        conn.close()
+        return item
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get overall statistics"""
+        with self.pool.reader() as conn:
+            cursor = conn.cursor()
+            
+            # Site statistics
+            cursor.execute("""
+                SELECT s.name, s.url, s.last_scraped, s.total_items,
+                       COUNT(i.id) as tracked_items,
+                       COUNT(CASE WHEN i.first_seen >= datetime('now', '-7 days') THEN 1 END) as new_this_week
+                FROM sites s
+                LEFT JOIN items i ON s.id = i.site_id AND i.is_active = 1
+                GROUP BY s.id, s.name, s.url, s.last_scraped, s.total_items
+            """)
+            
+            sites = []
+            for row in cursor.fetchall():
+                sites.append({
+                    'name': row[0],
+                    'url': row[1],
+                    'last_scraped': row[2],
+                    'total_items': row[3],
+                    'tracked_items': row[4],
+                    'new_this_week': row[5]
+                })
+            
+            # Recent runs
+            cursor.execute("""
+                SELECT s.name, r.run_timestamp, r.items_found, r.new_items, r.status
+                FROM scraping_runs r
+                JOIN sites s ON r.site_id = s.id
+                ORDER BY r.run_timestamp DESC
+                LIMIT 10
+            """)
+            
+            recent_runs = []
+            for row in cursor.fetchall():
+                recent_runs.append({
+                    'site': row[0],
+                    'timestamp': row[1],
+                    'items_found': row[2],
+                    'new_items': row[3],
+                    'status': row[4]
+                })
+            
+            # Last weekly run
+            cursor.execute("""
+                SELECT r.finished, r.duration_seconds, r.total_new,
+                       COUNT(CASE WHEN NOT i.success THEN 1 END) as failed
+                FROM runs_summary r
+                LEFT JOIN run_items i ON i.run_id = r.id
+                GROUP BY r.id
+                ORDER BY r.id DESC
+                LIMIT 1
+            """)
+            row = cursor.fetchone()
+            last_weekly_run = None
+            if row:
+                last_weekly_run = {
+                    'finished': row[0],
+                    'duration_seconds': row[1],
+                    'total_new': row[2],
+                    'failed_scrapers': row[3]
+                }
         
         return {
             'sites': sites,
-            'recent_runs': recent_runs
+            'recent_runs': recent_runs,
+            'last_weekly_run': last_weekly_run
         }
\ No newline at end of file
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Event loop selection for the scraper entry points
+"""
+
+import asyncio
+import sys
+
+# libuv-backed event loop; not available on Windows or when uvloop is missing
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def run(coro):
+    """Run a coroutine to completion, on uvloop where it is available"""
+    if uvloop is None or sys.platform == 'win32' or not hasattr(asyncio, 'Runner'):
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
@@ -19,48 +19,61 @@ class LovableScraperFinal:
         self.historical_apps = []
         self.all_apps = []
         
-    async def scrape_all_apps(self):
+    async def scrape_all_apps(self, browser=None):
         """Main scraping function that extracts current and historical apps"""
+        # A browser passed in (e.g. the weekly run's shared one) is left open
+        if browser is not None:
+            await self._scrape_with_browser(browser)
+            return
+        
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
             try:
-                print(f"Navigating to {self.base_url}")
-                await page.goto(self.base_url, wait_until="networkidle")
-                
-                # Wait for content to load
-                await page.wait_for_timeout(5000)
-                
-                # Scroll to load all content
-                await self.scroll_to_load_content(page)
-                
-                # Get page content
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                # Extract current week's top apps
-                self.extract_current_week_apps(soup)
-                
-                # Extract historical weekly winners  
-                self.extract_historical_apps(soup)
-                
-                # Combine all apps
-                self.all_apps = self.current_week_apps + self.historical_apps
-                
-                print(f"\nScraping completed!")
-                print(f"Current week apps: {len(self.current_week_apps)}")
-                print(f"Historical apps: {len(self.historical_apps)}")
-                print(f"Total apps: {len(self.all_apps)}")
-                
-            except Exception as e:
-                print(f"Error during scraping: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                
+                await self._scrape_with_browser(browser)
             finally:
                 await browser.close()
     
+    async def _scrape_with_browser(self, browser):
+        """Scrape using a fresh context of the given browser"""
+        context = await browser.new_context()
+        page = await context.new_page()
+        
+        try:
+            print(f"Navigating to {self.base_url}")
+            await page.goto(self.base_url, wait_until="networkidle")
+            
+            # Wait for content to load
+            await page.wait_for_timeout(5000)
+            
+            # Scroll to load all content
+            await self.scroll_to_load_content(page)
+            
+            # Get page content
+            content = await page.content()
+            soup = BeautifulSoup(content, 'html.parser')
+            
+            # Extract current week's top apps
+            self.extract_current_week_apps(soup)
+            
+            # Extract historical weekly winners  
+            self.extract_historical_apps(soup)
+            
+            # Combine all apps
+            self.all_apps = self.current_week_apps + self.historical_apps
+            
+            print(f"\nScraping completed!")
+            print(f"Current week apps: {len(self.current_week_apps)}")
+            print(f"Historical apps: {len(self.historical_apps)}")
+            print(f"Total apps: {len(self.all_apps)}")
+            
+        except Exception as e:
+            print(f"Error during scraping: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            
+        finally:
+            await context.close()
+    
     async def scroll_to_load_content(self, page):
         """Scroll down to trigger lazy loading of content"""
         try:
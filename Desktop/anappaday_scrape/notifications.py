@@ -4,7 +4,7 @@ Notification system for scraping results
 Supports Mac system notifications, email, and console output
 """
 
-import json
+import orjson
 import logging
 import smtplib
 from datetime import datetime
@@ -28,8 +28,8 @@ class NotificationConfig:
         """Load notification configuration"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    return orjson.loads(f.read())
             except Exception as e:
                 logger.error(f"Error loading config: {e}")
         
@@ -64,8 +64,8 @@ class NotificationConfig:
     def save_config(self):
         """Save current configuration"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
         except Exception as e:
             logger.error(f"Error saving config: {e}")
     
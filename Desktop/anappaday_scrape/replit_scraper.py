@@ -5,84 +5,348 @@ Handles anti-bot measures and dynamic loading
 """
 
 import asyncio
-import json
+import os
 import time
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from collections import Counter
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from browser_pool import BrowserPool, HIDE_WEBDRIVER_JS
+from dataclasses import dataclass
+from typing import List, Optional
 import re
+from pathlib import Path
+import orjson
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+REPLIT_ORIGIN = "https://replit.com"
+REPLIT_ORIGIN_SLASH = REPLIT_ORIGIN + "/"
+
+# Only the HTML and the scripts/XHR that hydrate it are needed
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+BLOCKED_DOMAINS = ('google-analytics', 'doubleclick', 'segment.io', 'hotjar')
+
+
+async def _block_heavy_resources(route):
+    """Abort requests the scraper never reads so navigation is not waiting on them"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(d in request.url for d in BLOCKED_DOMAINS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Resolves as soon as the page grows taller or renders more project cards
+CONTENT_GREW_JS = """([height, count]) =>
+    document.body.scrollHeight > height ||
+    document.querySelectorAll('[data-testid*="project"]').length > count"""
+CONTENT_SNAPSHOT_JS = """() => [
+    document.body.scrollHeight,
+    document.querySelectorAll('[data-testid*="project"]').length
+]"""
+NEW_CONTENT_TIMEOUT_MS = 5000
+
+# Paginated gallery URLs that failed to load are skipped on later runs until
+# the entry expires, so a dead page does not cost a navigation timeout every week.
+# Kept next to this script so it does not depend on the working directory.
+DEAD_URL_CACHE = Path(__file__).resolve().parent / 'replit_dead_urls.json'
+DEAD_URL_TTL_SECONDS = 28 * 24 * 3600
+
+# Shared parser: skip the id hash table and never touch the network
+HTML_PARSER = lxml_html.HTMLParser(collect_ids=False, no_network=True, huge_tree=True)
+
+# Candidate selector strategies for Replit Gallery, matched as one union
+PROJECT_CARD_SELECTOR = CSSSelector(', '.join([
+    # Common Replit selectors
+    '[data-testid*="project"]',
+    '[data-testid*="repl"]',
+    '.repl-card',
+    '.project-card',
+    # Generic card patterns
+    '.card',
+    '[class*="card"]',
+    # Grid/list patterns
+    '.grid > div',
+    '.gallery > div',
+    '[class*="gallery"] > div',
+    '[class*="grid"] > div',
+    # Link-based project cards
+    'a[href*="/repl/"]',
+    'a[href*="/@"]'
+]))
+
+# Compiled once at import time; each query walks a card's subtree a single time
+# and returns candidates in document order.
+TITLE_XP = etree.XPath(
+    "(.//h1|.//h2|.//h3|.//h4"
+    "|.//*[contains(@data-testid,'title')]"
+    "|.//*[contains(@class,'title') or contains(@class,'name')])"
+)
+DESC_XP = etree.XPath(
+    "(.//p"
+    "|.//*[contains(@data-testid,'description')]"
+    "|.//*[contains(@class,'description') or contains(@class,'summary')])"
+)
+AUTHOR_XP = etree.XPath(
+    "(.//*[contains(@data-testid,'author')]"
+    "|.//*[contains(@class,'author') or contains(@class,'creator') or contains(@class,'username')])"
+)
+TAG_XP = etree.XPath(
+    ".//*[contains(@class,'tag') or contains(@class,'badge')"
+    " or contains(@class,'label') or contains(@class,'language')]"
+)
+LINK_XP = etree.XPath("(descendant-or-self::a)[1]/@href")
+IMG_XP = etree.XPath("(descendant::img)[1]")
+
+STAR_RE = re.compile(r'(\d+)\s*(?:star|★)', re.IGNORECASE)
+FORK_RE = re.compile(r'(\d+)\s*(?:fork|🍴)', re.IGNORECASE)
+LANGUAGES = ('Python', 'JavaScript', 'Java', 'C++', 'C#', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin')
+# Lookarounds instead of \b so that "C++" and "C#" can still match at a word end
+LANGUAGE_RE = re.compile(r'(?<!\w)(' + '|'.join(map(re.escape, LANGUAGES)) + r')(?!\w)')
+
+# One automaton finds every language name in a single pass over the card text;
+# without pyahocorasick the compiled regex above is used instead
+if ahocorasick is not None:
+    LANG_AC = ahocorasick.Automaton()
+    for _lang in LANGUAGES:
+        LANG_AC.add_word(_lang, _lang)
+    LANG_AC.make_automaton()
+else:
+    LANG_AC = None
+
+
+def _stripped_text(element) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True) for lxml elements"""
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def _card_text(element) -> str:
+    """Whole-card text with each text node stripped and joined by single spaces"""
+    return ' '.join(part for part in (p.strip() for p in element.itertext()) if part)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+def detect_language(text: str) -> Optional[str]:
+    """Return the first language name in text that stands alone as a word"""
+    if LANG_AC is None:
+        match = LANGUAGE_RE.search(text)
+        return match.group(1) if match else None
+    
+    # Matches arrive ordered by end offset; reject hits inside longer words
+    # (e.g. "Java" in "JavaScript", "Go" in "Google")
+    for end, lang in LANG_AC.iter(text):
+        start = end - len(lang) + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        return lang
+    return None
+
+
+def _first_text(elements, min_len: int, max_len: int):
+    """Return the first element text whose length falls strictly within bounds"""
+    for el in elements:
+        text = _stripped_text(el)
+        if min_len < len(text) < max_len:
+            return text
+    return None
+
+
+@dataclass(slots=True)
+class Project:
+    """A single Replit Gallery project (fixed fields, no per-instance dict)"""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    creator_name: Optional[str] = None
+    app_url: Optional[str] = None
+    screenshot_url: Optional[str] = None
+    language: Optional[str] = None
+    stars: Optional[int] = None
+    forks: Optional[int] = None
+    created_date: Optional[str] = None
+    submitted_by: str = 'system'
+    category: str = 'general'
+    submission_date: str = ''
+
 
 class ReplitGalleryScraper:
-    def __init__(self):
+    def __init__(self, max_pages: int = 5, concurrency: int = 5):
         self.base_url = "https://replit.com/gallery"
         self.projects_data = []
-        
-    async def scrape_all_projects(self):
+        # Gallery pages are scraped by `concurrency` workers, each reusing one
+        # tab, all sharing one browser context
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        # url -> unix time of the last failed navigation
+        self.dead_urls = {}
+        # Cache contents as last read or written, to skip unchanged saves
+        self._saved_dead_urls = {}
+        
+    async def scrape_all_projects(self, browser=None):
         """Main scraping function that handles Replit Gallery structure"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor'
-                ]
-            )
+        # Reuse the long-lived browser; only the context is per run
+        browser = browser or await BrowserPool.get_browser()
+        
+        context = await browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        )
+        await context.add_init_script(HIDE_WEBDRIVER_JS)
+        
+        # Set extra headers to appear more like a real browser
+        await context.set_extra_http_headers({
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none'
+        })
+        await context.route("**/*", _block_heavy_resources)
+        self.dead_urls = self.load_dead_urls()
+        self._saved_dead_urls = dict(self.dead_urls)
+        
+        try:
+            page_results = await self.scrape_pages(context)
             
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
+            # Merge pages, dropping projects already seen on an earlier page
+            seen = set()
+            for idx, result in enumerate(page_results, start=1):
+                if isinstance(result, Exception):
+                    print(f"Error scraping gallery page {idx}: {result}")
+                    continue
+                for project_data in result:
+                    key = (project_data.title, project_data.app_url)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    self.projects_data.append(project_data)
             
-            page = await context.new_page()
+            print(f"\nScraping completed! Total projects found: {len(self.projects_data)}")
             
-            try:
-                print(f"Navigating to {self.base_url}")
-                
-                # Set extra headers to appear more like a real browser
-                await page.set_extra_http_headers({
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none'
-                })
-                
-                # Try to navigate to the page
-                response = await page.goto(self.base_url, wait_until="networkidle", timeout=30000)
-                
-                if response.status != 200:
-                    print(f"Failed to load page. Status: {response.status}")
-                    return
-                
-                print("Page loaded successfully, waiting for content...")
-                await page.wait_for_timeout(5000)
-                
-                # Handle potential dynamic loading
-                await self.handle_dynamic_loading(page)
-                
-                # Extract projects from the page
-                await self.extract_projects_from_page(page)
-                
-                print(f"\nScraping completed! Total projects found: {len(self.projects_data)}")
-                
-            except Exception as e:
-                print(f"Error during scraping: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                
-                # Try to save partial data if any was collected
-                if self.projects_data:
-                    print(f"Saving partial data ({len(self.projects_data)} projects)...")
-                    self.save_to_json('replit_projects_partial.json')
-                
-            finally:
-                await browser.close()
+        except Exception as e:
+            print(f"Error during scraping: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            
+            # Try to save partial data if any was collected
+            if self.projects_data:
+                print(f"Saving partial data ({len(self.projects_data)} projects)...")
+                self.save_to_json('replit_projects_partial.json')
+            
+        finally:
+            self.save_dead_urls()
+            await context.close()
+    
+    async def scrape_pages(self, context) -> list:
+        """Scrape every gallery page with a fixed pool of tab workers.
+        
+        Returns one entry per page, in page order: its projects, or the
+        exception that page raised.
+        """
+        queue = asyncio.Queue()
+        for idx in range(1, self.max_pages + 1):
+            queue.put_nowait(idx)
+        results = [[] for _ in range(self.max_pages)]
+        
+        workers = [
+            asyncio.create_task(self.page_worker(context, queue, results))
+            for _ in range(min(self.concurrency, self.max_pages))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return results
+    
+    async def page_worker(self, context, queue: asyncio.Queue, results: list):
+        """Pull page numbers off the queue and scrape them, reusing one tab"""
+        page = None
+        try:
+            while True:
+                idx = await queue.get()
+                try:
+                    if page is None:
+                        page = await context.new_page()
+                    results[idx - 1] = await self.scrape_page(page, idx)
+                except Exception as e:
+                    results[idx - 1] = e
+                    # A failed navigation can leave the tab unusable; use a fresh one next
+                    if page is not None:
+                        try:
+                            await page.close()
+                        except Exception:
+                            pass
+                        page = None
+                finally:
+                    queue.task_done()
+        finally:
+            if page is not None:
+                await page.close()
+    
+    async def scrape_page(self, page, idx: int) -> List[Project]:
+        """Scrape one gallery page in the given tab and return its projects"""
+        url = self.base_url if idx == 1 else f"{self.base_url}?page={idx}"
+        
+        # The base gallery page is always attempted; only pagination is cached
+        failed_at = self.dead_urls.get(url)
+        if idx > 1 and failed_at and time.time() - failed_at < DEAD_URL_TTL_SECONDS:
+            print(f"Skipping {url} (failed on a recent run)")
+            return []
+        
+        print(f"Navigating to {url}")
+        try:
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        except PlaywrightTimeoutError:
+            self.dead_urls[url] = time.time()
+            raise
+        
+        if not response or response.status != 200:
+            print(f"Failed to load {url}. Status: {response.status if response else 'no response'}")
+            self.dead_urls[url] = time.time()
+            return []
+        self.dead_urls.pop(url, None)
+        
+        print(f"Page {idx} loaded successfully, waiting for content...")
+        await page.wait_for_timeout(5000)
+        
+        # Handle potential dynamic loading
+        await self.handle_dynamic_loading(page)
+        
+        # Extract projects from the page
+        return await self.extract_projects_from_page(page)
+    
+    def load_dead_urls(self) -> dict:
+        """Load the on-disk cache of gallery URLs that recently failed to load"""
+        try:
+            return orjson.loads(DEAD_URL_CACHE.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+    
+    def save_dead_urls(self):
+        """Persist failed gallery URLs, dropping entries that have expired"""
+        now = time.time()
+        fresh = {url: ts for url, ts in self.dead_urls.items() if now - ts < DEAD_URL_TTL_SECONDS}
+        if fresh == self._saved_dead_urls:
+            return
+        try:
+            DEAD_URL_CACHE.write_bytes(orjson.dumps(fresh))
+            self._saved_dead_urls = fresh
+        except OSError as e:
+            print(f"Could not save dead URL cache: {e}")
     
     async def handle_dynamic_loading(self, page):
         """Handle dynamic content loading (infinite scroll, load more buttons, etc.)"""
@@ -98,6 +362,9 @@ class ReplitGalleryScraper:
                 'button[class*="load"]'
             ]
             
+            # Selectors that matched nothing are not probed again on later attempts
+            dead_selectors = set()
+            
             loaded_more = True
             attempts = 0
             max_attempts = 5
@@ -108,15 +375,24 @@ class ReplitGalleryScraper:
                 
                 # Try clicking load more buttons
                 for selector in load_more_selectors:
+                    if selector in dead_selectors:
+                        continue
                     try:
                         button = await page.query_selector(selector)
-                        if button:
+                        if not button:
+                            dead_selectors.add(selector)
+                        else:
                             is_visible = await button.is_visible()
                             if is_visible:
                                 print(f"Found load more button, clicking... (attempt {attempts})")
+                                snapshot = await page.evaluate(CONTENT_SNAPSHOT_JS)
                                 await button.click()
-                                await page.wait_for_timeout(3000)
-                                loaded_more = True
+                                try:
+                                    # Return the moment new cards render instead of sleeping
+                                    await page.wait_for_function(CONTENT_GREW_JS, arg=snapshot, timeout=NEW_CONTENT_TIMEOUT_MS)
+                                    loaded_more = True
+                                except PlaywrightTimeoutError:
+                                    print("Load more click produced no new content")
                                 break
                     except Exception as e:
                         continue
@@ -128,116 +404,99 @@ class ReplitGalleryScraper:
                     
                     # Scroll to bottom
                     await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                    await page.wait_for_timeout(3000)
                     
                     # Check if more content loaded
+                    try:
+                        await page.wait_for_function(
+                            "h => document.body.scrollHeight > h", arg=prev_height, timeout=NEW_CONTENT_TIMEOUT_MS
+                        )
+                    except PlaywrightTimeoutError:
+                        break
                     new_height = await page.evaluate('document.body.scrollHeight')
-                    if new_height > prev_height:
-                        loaded_more = True
-                        print(f"New content loaded via scroll (height: {prev_height} -> {new_height})")
-                
-                if loaded_more:
-                    await page.wait_for_timeout(2000)
+                    loaded_more = True
+                    print(f"New content loaded via scroll (height: {prev_height} -> {new_height})")
             
             print(f"Dynamic loading completed after {attempts} attempts")
             
         except Exception as e:
             print(f"Error in dynamic loading: {e}")
     
-    async def extract_projects_from_page(self, page):
+    async def extract_projects_from_page(self, page) -> List[Project]:
         """Extract project data from the current page state"""
         print("Extracting projects from page...")
         
-        content = await page.content()
+        # Cards only live in <body>; skip serialising <head> across CDP
+        content = await page.inner_html('body')
+        if not content.strip():
+            return []
         
-        # Save debug HTML
-        with open('replit_debug.html', 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Save debug HTML only when asked, without blocking the event loop
+        if os.environ.get('SCRAPER_DEBUG'):
+            await asyncio.to_thread(Path('replit_debug.html').write_text, content, encoding='utf-8')
         
-        soup = BeautifulSoup(content, 'html.parser')
+        tree = lxml_html.fromstring(content, parser=HTML_PARSER)
         
         projects = []
         
-        # Try multiple selector strategies for Replit Gallery
-        project_selectors = [
-            # Common Replit selectors
-            '[data-testid*="project"]',
-            '[data-testid*="repl"]',
-            '.repl-card',
-            '.project-card',
-            # Generic card patterns
-            '.card',
-            '[class*="card"]',
-            # Grid/list patterns
-            '.grid > div',
-            '.gallery > div',
-            '[class*="gallery"] > div',
-            '[class*="grid"] > div',
-            # Link-based project cards
-            'a[href*="/repl/"]',
-            'a[href*="/@"]'
-        ]
-        
+        # One traversal with a union matcher instead of one full-tree walk per selector.
+        # Each card's text is extracted once and shared by the filter and the extractor.
         project_elements = []
-        for selector in project_selectors:
-            try:
-                elements = soup.select(selector)
-                if elements:
-                    # Filter for elements that look like project cards
-                    filtered_elements = []
-                    for el in elements:
-                        if self.looks_like_project_card(el):
-                            filtered_elements.append(el)
-                    
-                    if len(filtered_elements) > 5:  # Should find multiple projects
-                        project_elements = filtered_elements
-                        print(f"Using selector '{selector}' found {len(filtered_elements)} project elements")
-                        break
-            except Exception as e:
-                continue
+        for el in PROJECT_CARD_SELECTOR(tree):
+            text = _card_text(el)
+            if self.looks_like_project_card(el, text):
+                project_elements.append((el, text))
+        
+        if len(project_elements) > 5:  # Should find multiple projects
+            print(f"Combined selectors found {len(project_elements)} project elements")
+        else:
+            project_elements = []
         
         # Fallback: look for any links that might be projects
         if not project_elements:
             print("Trying fallback approach...")
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
+            for link in tree.iter('a'):
                 href = link.get('href', '')
                 if ('/@' in href and '/repl/' in href) or '/repl/' in href:
-                    if self.looks_like_project_card(link):
-                        project_elements.append(link)
+                    text = _card_text(link)
+                    if self.looks_like_project_card(link, text):
+                        project_elements.append((link, text))
         
         print(f"Processing {len(project_elements)} potential project elements")
         
-        for element in project_elements:
-            project_data = self.extract_project_details(element)
-            if project_data and project_data.get('title'):
+        seen = set()
+        for element, text in project_elements:
+            project_data = self.extract_project_details(element, text)
+            if project_data:
                 # Avoid duplicates
-                if not any(existing.get('title') == project_data['title'] and 
-                          existing.get('app_url') == project_data['app_url'] for existing in projects):
-                    projects.append(project_data)
+                key = (project_data.title, project_data.app_url)
+                if key in seen:
+                    continue
+                seen.add(key)
+                projects.append(project_data)
         
-        self.projects_data = projects
         print(f"Successfully extracted {len(projects)} unique projects")
+        return projects
     
-    def looks_like_project_card(self, element) -> bool:
+    def looks_like_project_card(self, element, text: Optional[str] = None) -> bool:
         """Check if element looks like a project card"""
         try:
-            text = element.get_text(strip=True)
+            if text is None:
+                text = _card_text(element)
             
             # Should have reasonable text length
             if len(text) < 10 or len(text) > 1000:
                 return False
             
             # Should have images or links
-            has_img = bool(element.find('img'))
-            has_link = bool(element.find('a')) or element.name == 'a'
+            has_img = element.find('.//img') is not None
+            has_link = element.find('.//a') is not None or element.tag == 'a'
             
             if not (has_img or has_link):
                 return False
             
             # Should not be navigation elements
             nav_indicators = ['nav', 'menu', 'header', 'footer', 'sidebar']
-            classes = ' '.join(element.get('class', []))
+            classes = element.get('class', '')
             if any(indicator in classes.lower() for indicator in nav_indicators):
                 return False
             
@@ -246,190 +505,109 @@ class ReplitGalleryScraper:
         except Exception:
             return False
     
-    def extract_project_details(self, element) -> Dict[str, Any]:
+    def extract_project_details(self, element, text_content: Optional[str] = None) -> Optional[Project]:
         """Extract project details from a single element"""
-        project_data = {
-            'title': None,
-            'description': None,
-            'creator_name': None,
-            'app_url': None,
-            'screenshot_url': None,
-            'tags': [],
-            'language': None,
-            'stars': None,
-            'forks': None,
-            'created_date': None,
-            'submitted_by': 'system'
-        }
-        
-        # Extract title
-        title_selectors = [
-            'h1', 'h2', 'h3', 'h4',
-            '[data-testid*="title"]',
-            '.title', '.name', '.project-name',
-            '[class*="title"]', '[class*="name"]'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = element.select_one(selector)
-            if title_elem:
-                title_text = title_elem.get_text(strip=True)
-                if len(title_text) > 2 and len(title_text) < 100:
-                    project_data['title'] = title_text
-                    break
+        # Extract title; cards without one are discarded, so stop early
+        title = _first_text(TITLE_XP(element), 2, 100)
+        if not title:
+            return None
+        project = Project(title=title)
         
         # Extract description
-        desc_selectors = [
-            'p', '.description', '.summary',
-            '[data-testid*="description"]',
-            '[class*="description"]', '[class*="summary"]'
-        ]
-        
-        for selector in desc_selectors:
-            desc_elem = element.select_one(selector)
-            if desc_elem:
-                desc_text = desc_elem.get_text(strip=True)
-                if len(desc_text) > 10 and len(desc_text) < 500:
-                    project_data['description'] = desc_text
-                    break
+        project.description = _first_text(DESC_XP(element), 10, 500)
         
         # Extract author
-        author_selectors = [
-            '[data-testid*="author"]',
-            '.author', '.creator', '.username',
-            '[class*="author"]', '[class*="creator"]'
-        ]
-        
-        for selector in author_selectors:
-            author_elem = element.select_one(selector)
-            if author_elem:
-                author_text = author_elem.get_text(strip=True)
-                if len(author_text) > 1 and len(author_text) < 50:
-                    project_data['creator_name'] = author_text
-                    break
+        project.creator_name = _first_text(AUTHOR_XP(element), 1, 50)
         
         # Extract URL
-        link_elem = element if element.name == 'a' else element.find('a')
-        if link_elem:
-            href = link_elem.get('href')
-            if href:
-                project_data['app_url'] = self.normalize_url(href)
+        hrefs = LINK_XP(element)
+        if hrefs:
+            project.app_url = self.normalize_url(hrefs[0])
         
         # Extract image
-        img_elem = element.find('img')
-        if img_elem:
-            img_src = img_elem.get('src') or img_elem.get('data-src')
+        imgs = IMG_XP(element)
+        if imgs:
+            img_src = imgs[0].get('src') or imgs[0].get('data-src')
             if img_src:
-                project_data['screenshot_url'] = self.normalize_url(img_src)
+                project.screenshot_url = self.normalize_url(img_src)
         
         # Extract tags/languages
-        tag_selectors = [
-            '.tag', '.badge', '.label', '.language',
-            '[class*="tag"]', '[class*="badge"]', '[class*="language"]'
-        ]
+        tags = []
+        for tag in TAG_XP(element):
+            tag_text = _stripped_text(tag)
+            if tag_text and len(tag_text) < 30:
+                tags.append(tag_text)
         
-        for selector in tag_selectors:
-            tag_elements = element.select(selector)
-            if tag_elements:
-                tags = []
-                for tag in tag_elements:
-                    tag_text = tag.get_text(strip=True)
-                    if tag_text and len(tag_text) < 30:
-                        tags.append(tag_text)
-                if tags:
-                    project_data['tags'] = tags[:5]  # Limit to 5 tags
-                    break
+        # Language and metrics all scan the same card text
+        if text_content is None:
+            text_content = _card_text(element)
         
         # Try to extract language from text content
-        if not project_data['language']:
-            text_content = element.get_text()
-            languages = ['Python', 'JavaScript', 'Java', 'C++', 'C#', 'Ruby', 'Go', 'Rust', 'Swift', 'Kotlin']
-            for lang in languages:
-                if lang in text_content:
-                    project_data['language'] = lang
-                    break
+        project.language = detect_language(text_content)
         
         # Extract metrics (stars, forks, etc.)
-        metrics_text = element.get_text()
-        
         # Look for star patterns
-        star_match = re.search(r'(\d+)\s*(?:star|★)', metrics_text, re.IGNORECASE)
+        star_match = STAR_RE.search(text_content)
         if star_match:
-            project_data['stars'] = int(star_match.group(1))
+            project.stars = int(star_match.group(1))
         
         # Look for fork patterns
-        fork_match = re.search(r'(\d+)\s*(?:fork|🍴)', metrics_text, re.IGNORECASE)
+        fork_match = FORK_RE.search(text_content)
         if fork_match:
-            project_data['forks'] = int(fork_match.group(1))
+            project.forks = int(fork_match.group(1))
         
-        # Convert tags to single category and add required fields
-        if project_data['tags']:
-            project_data['category'] = project_data['tags'][0]
-        else:
-            # Use language as category if available, otherwise default
-            project_data['category'] = project_data.get('language') or 'general'
+        # Collapse tags to a single category, falling back to language
+        project.category = tags[0] if tags else (project.language or 'general')
+        project.submission_date = time.strftime('%Y-%m-%d %H:%M:%S')
         
-        project_data['submission_date'] = time.strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Remove tags array since we now have single category
-        del project_data['tags']
-        
-        return project_data if project_data.get('title') else None
+        return project
     
     def normalize_url(self, url):
         """Normalize URLs to be absolute"""
         if not url:
             return None
-        if url.startswith('http'):
+        # Absolute URLs are returned untouched; slicing/indexing avoids startswith lookups
+        if url[:4] == 'http':
             return url
-        elif url.startswith('/'):
-            return f"https://replit.com{url}"
-        else:
-            return f"https://replit.com/{url}"
+        if url[0] == '/':
+            return REPLIT_ORIGIN + url
+        return REPLIT_ORIGIN_SLASH + url
     
     def save_to_json(self, filename: str = 'replit_projects.json'):
         """Save scraped data to JSON file"""
         # Create summary statistics
         total_projects = len(self.projects_data)
         
-        # Count languages and tags
-        all_languages = [p.get('language') for p in self.projects_data if p.get('language')]
-        all_tags = []
-        for project in self.projects_data:
-            all_tags.extend(project.get('tags', []))
-        
-        language_counts = {}
-        for lang in all_languages:
-            language_counts[lang] = language_counts.get(lang, 0) + 1
-        
-        tag_counts = {}
-        for tag in all_tags:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        # Count languages
+        language_counts = Counter(p.language for p in self.projects_data if p.language)
         
         data = {
             'scrape_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
             'source_website': 'https://replit.com/gallery',
             'total_projects_found': total_projects,
             'description': 'Projects from Replit Gallery',
-            'language_summary': dict(sorted(language_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
-            'tag_summary': dict(sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]),
+            'language_summary': dict(language_counts.most_common(10)),
             'projects': self.projects_data
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson pretty-prints in native code, always emits UTF-8 and
+        # serialises Project dataclasses directly
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         print(f"\nData saved to {filename}")
         print(f"Total projects scraped: {total_projects}")
         if language_counts:
             print(f"Top languages: {list(language_counts.keys())[:5]}")
-        if tag_counts:
-            print(f"Top tags: {list(tag_counts.keys())[:5]}")
 
 async def main():
     scraper = ReplitGalleryScraper()
-    await scraper.scrape_all_projects()
+    try:
+        await scraper.scrape_all_projects()
+    finally:
+        await BrowserPool.close()
     scraper.save_to_json()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    from event_loop import run
+    run(main())
\ No newline at end of file
@@ -4,8 +4,6 @@ Scheduler system for running scrapers weekly
 """
 
 import asyncio
-import schedule
-import time
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
@@ -15,14 +13,30 @@ import sys
 from pathlib import Path
 
 from weekly_scraper import WeeklyScraper
+from browser_pool import BrowserPool
+from event_loop import run
 
 logger = logging.getLogger(__name__)
 
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+def next_weekday_at(day: str, time_str: str, now: Optional[datetime] = None) -> datetime:
+    """Return the next datetime falling on `day` at `time_str` (HH:MM), strictly after now"""
+    now = now or datetime.now()
+    hour, minute = (int(part) for part in time_str.split(":"))
+    days_ahead = (WEEKDAYS.index(day.lower()) - now.weekday()) % 7
+    candidate = (now + timedelta(days=days_ahead)).replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if candidate <= now:
+        candidate += timedelta(weeks=1)
+    return candidate
+
 class ScrapingScheduler:
     def __init__(self):
         self.weekly_scraper = WeeklyScraper()
         self.is_running = True
         self.current_task = None
+        self.day = "monday"
+        self.time_str = "09:00"
         
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -75,39 +89,52 @@ class ScrapingScheduler:
         """Schedule the weekly job"""
         logger.info(f"📅 Scheduling weekly scraping for every {day.title()} at {time_str}")
         
-        # Schedule the job
-        getattr(schedule.every(), day.lower()).at(time_str).do(
-            lambda: asyncio.run(self.run_scheduled_scraping())
-        )
+        # Validate now rather than at the first fire time
+        next_weekday_at(day, time_str)
+        self.day = day
+        self.time_str = time_str
     
-    def run_scheduler(self, check_interval: int = 60):
-        """Run the scheduler loop"""
-        logger.info(f"🔄 Scheduler started, checking every {check_interval} seconds")
+    async def run_scheduler_async(self):
+        """Sleep until each scheduled run and execute it on this event loop"""
+        next_run = next_weekday_at(self.day, self.time_str)
+        logger.info(f"🔄 Scheduler started, next run at {next_run.strftime('%Y-%m-%d %H:%M')}")
         
-        while self.is_running:
-            try:
-                schedule.run_pending()
-                time.sleep(check_interval)
-            except KeyboardInterrupt:
-                logger.info("Scheduler interrupted by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in scheduler loop: {str(e)}")
-                time.sleep(check_interval)
-        
-        logger.info("Scheduler stopped")
+        # The shared browser lives as long as this loop, so every weekly run reuses it
+        await BrowserPool.init()
+        try:
+            while self.is_running:
+                delay = (next_run - datetime.now()).total_seconds()
+                await asyncio.sleep(max(delay, 0))
+                
+                try:
+                    await self.run_scheduled_scraping()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in scheduler loop: {str(e)}")
+                
+                # Skip any slots missed while the run was in progress
+                while next_run <= datetime.now():
+                    next_run += timedelta(weeks=1)
+                logger.info(f"⏭️ Next run at {next_run.strftime('%Y-%m-%d %H:%M')}")
+        finally:
+            await BrowserPool.close()
+            logger.info("Scheduler stopped")
 
 def run_scheduler_daemon(day: str = "monday", time_str: str = "09:00"):
     """Run scheduler as a daemon"""
     scheduler = ScrapingScheduler()
     scheduler.schedule_weekly_job(day, time_str)
-    scheduler.run_scheduler()
+    run(scheduler.run_scheduler_async())
 
 def run_once_now():
     """Run scraping once immediately (for testing)"""
     async def _run():
         scraper = WeeklyScraper()
-        results = await scraper.run_all_scrapers()
+        try:
+            results = await scraper.run_all_scrapers()
+        finally:
+            await BrowserPool.close()
         
         # Generate and print report
         report = scraper.generate_weekly_report()
@@ -115,7 +142,7 @@ def run_once_now():
         
         return results
     
-    return asyncio.run(_run())
+    return run(_run())
 
 if __name__ == "__main__":
     import argparse
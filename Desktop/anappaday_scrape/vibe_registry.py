@@ -48,31 +48,251 @@ graphics.
 """
 
 import argparse
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 import contextlib
+import csv
 import datetime as _dt
+import functools
+import html
+import importlib.util
+import io
+import itertools
 import json
 import os
+import re
 from pathlib import Path
 import sqlite3
+import threading
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 # External dependencies.  These imports will fail unless the user installs
-# playwright and BeautifulSoup.  They're intentionally localised here so
-# that unit tests or dry runs of other commands don't immediately require
-# network‑heavy components.  If you only run `init-db` or `export` you
-# won't need these libraries.
+# playwright.  They're intentionally localised here so that unit tests or dry
+# runs of other commands don't immediately require network‑heavy components.
+# If you only run `init-db` or `export` you won't need these libraries.
 try:
-    from bs4 import BeautifulSoup  # type: ignore
-    from playwright.sync_api import Playwright, sync_playwright
+    from playwright.async_api import async_playwright
 except ImportError:
-    BeautifulSoup = None  # type: ignore
-    sync_playwright = None  # type: ignore
+    async_playwright = None  # type: ignore
+
+# Optional: with lxml and httpx installed, detail pages are fetched over plain
+# HTTP and only rendered in the browser when needed.
+try:
+    from lxml import etree, html as lxml_html  # type: ignore
+except ImportError:
+    etree = None  # type: ignore
+    lxml_html = None  # type: ignore
+
+try:
+    import httpx  # type: ignore
+except ImportError:
+    httpx = None  # type: ignore
+
+# httpx only speaks HTTP/2 when its h2 extra is installed; without it,
+# http2=True raises ImportError, so fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Maximum number of detail pages rendered at once per listing page
+DETAIL_CONCURRENCY = 5
+# Connection cap for plain HTTP detail fetches
+HTTP_MAX_CONNECTIONS = 20
+# Browser timeouts for detail pages: navigation (to DOMContentLoaded) and the
+# subsequent wait for og:title on client-rendered pages
+DETAIL_TIMEOUT_MS = 15000
+META_WAIT_TIMEOUT_MS = 3000
+# Resource types never needed for metadata extraction; only blocked when no
+# screenshots are being captured
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+
+# -----------------------------------------------------------------------------
+# Detail page parsing
+#
+
+# Runs inside a listing page and returns the absolute detail URLs in page
+# order, without duplicates or sign-up/login links.
+BASE44_LISTING_LINKS_JS = """
+() => {
+    const links = new Set();
+    for (const a of document.querySelectorAll('a[href^="/apps/"]')) {
+        const href = a.href;
+        if (!href.includes('signup') && !href.includes('login')) links.add(href);
+    }
+    return [...links];
+}
+"""
+
+# Runs inside the detail page and returns only the five raw attribute values,
+# so the DOM never has to be serialised and shipped back for parsing.
+# getAttribute() is used instead of .href so relative URLs are not resolved
+# and still fail the absolute-URL checks; the "Try " test looks only at the
+# anchor's first text node, ignoring leading whitespace.
+BASE44_DETAIL_JS = r"""
+() => {
+    const attr = (sel, name) => document.querySelector(sel)?.getAttribute(name) ?? null;
+    const tryText = /^\s*try\s+\S/i;
+    const tryLink = [...document.querySelectorAll('a')].find(a => {
+        const text = [...a.childNodes].find(n => n.nodeType === Node.TEXT_NODE);
+        return text && tryText.test(text.data);
+    });
+    return {
+        app_name: attr('meta[property="og:title"]', 'content'),
+        app_url: attr('link[rel="canonical"]', 'href'),
+        graphic_url_original: attr('meta[property="og:image"]', 'content'),
+        logo_url_original: attr('link[rel*="apple-touch-icon"]', 'href'),
+        download_url: tryLink ? tryLink.getAttribute('href') : null,
+    };
+}
+"""
+
+
+if etree is not None:
+    _OG_TITLE_XP = etree.XPath('string(//meta[@property="og:title"]/@content)')
+    _CANONICAL_XP = etree.XPath('string(//link[@rel="canonical"]/@href)')
+    _OG_IMAGE_XP = etree.XPath('string(//meta[@property="og:image"]/@content)')
+    _TOUCH_ICON_XP = etree.XPath('string(//link[contains(@rel, "apple-touch-icon")]/@href)')
+    # Evaluated inside libxml2; normalize-space() tolerates the indentation
+    # templates put before the anchor text
+    _TRY_LINK_XP = etree.XPath(
+        '//a[starts-with(translate(normalize-space(text()), "TRY", "try"), "try ")]/@href'
+    )
+
+
+# Byte-level patterns for the fast path: every <meta>/<link> tag in the head,
+# its attributes, and the first anchor whose text starts with "Try " (after
+# optional whitespace).
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.I)
+_HEAD_TAG_RE = re.compile(rb'<(meta|link)\b([^>]*)>', re.I)
+_ATTR_RE = re.compile(rb"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+_TRY_ANCHOR_RE = re.compile(rb'<a\b([^>]*)>\s*try\s+[^\s<]', re.I)
+
+
+def _tag_attrs(raw: bytes) -> Dict[bytes, str]:
+    """Decode the attributes of a single tag into a dict keyed by lowercase name."""
+    return {
+        m[1].lower(): html.unescape((m[2] or m[3] or m[4] or b'').decode('utf-8', 'replace'))
+        for m in _ATTR_RE.finditer(raw)
+    }
+
+
+def _scan_base44_detail(raw: bytes) -> Optional[Dict[str, Optional[str]]]:
+    """Regex fast path for :func:`parse_base44_detail`.
+
+    Returns None when og:title or the canonical link is missing so the caller
+    can fall back to a full parse.
+    """
+    head_end = _HEAD_END_RE.search(raw)
+    head = raw[:head_end.start()] if head_end else raw
+    found: Dict[str, str] = {}
+    for m in _HEAD_TAG_RE.finditer(head):
+        attrs = _tag_attrs(m[2])
+        if m[1].lower() == b'meta':
+            prop = attrs.get(b'property')
+            key = 'app_name' if prop == 'og:title' else 'graphic_url_original' if prop == 'og:image' else None
+            value = attrs.get(b'content', '')
+        else:
+            rel = attrs.get(b'rel', '')
+            key = 'app_url' if rel == 'canonical' else 'logo_url_original' if 'apple-touch-icon' in rel else None
+            value = attrs.get(b'href', '')
+        # Keep the first match in document order, as XPath string() does
+        if key and key not in found:
+            found[key] = value
+    try_anchor = _TRY_ANCHOR_RE.search(raw)
+    if try_anchor:
+        found['download_url'] = _tag_attrs(try_anchor[1]).get(b'href', '')
+    fields = {
+        key: (found.get(key, '').strip() or None)
+        for key in ('app_name', 'app_url', 'graphic_url_original', 'logo_url_original', 'download_url')
+    }
+    if not fields['app_name'] or not fields['app_url']:
+        return None
+    return fields
+
+
+def parse_base44_detail(content: str) -> Dict[str, Optional[str]]:
+    """Pull the raw metadata fields out of a Base44 detail page.
+
+    Returns a dict with ``app_name``, ``app_url``, ``graphic_url_original``,
+    ``logo_url_original`` and ``download_url``.  Values are stripped; missing
+    elements yield None, as do all fields of an empty page.  No validation is
+    applied here.  Well-formed pages are handled by a regex scan of the raw
+    bytes; anything else goes through lxml.
+    """
+    fields = _scan_base44_detail(content.encode('utf-8'))
+    if fields is not None:
+        return fields
+    try:
+        tree = lxml_html.fromstring(content)
+    except etree.ParserError:
+        # Empty or whitespace-only body: nothing to extract
+        return dict.fromkeys(('app_name', 'app_url', 'graphic_url_original', 'logo_url_original', 'download_url'))
+    try_links = _TRY_LINK_XP(tree)
+    fields = {
+        'app_name': _OG_TITLE_XP(tree),
+        'app_url': _CANONICAL_XP(tree),
+        'graphic_url_original': _OG_IMAGE_XP(tree),
+        'logo_url_original': _TOUCH_ICON_XP(tree),
+        'download_url': try_links[0] if try_links else '',
+    }
+    return {key: (value.strip() or None) for key, value in fields.items()}
 
 
 # -----------------------------------------------------------------------------
 # Database helper
 #
 
+# Statements are kept as module constants and executed on long-lived cursors
+# so they are not rebuilt on every call.
+_SQL_START_RUN = "INSERT INTO runs (started_at) VALUES (?)"
+
+_SQL_FINISH_RUN = """
+UPDATE runs
+SET finished_at=?, status=?, new_count=?, updated_count=?, error_count=?, log_excerpt=?
+WHERE id=?
+"""
+
+# Single UPSERT: on conflict keep existing values where the new ones are NULL.
+# first_seen is never touched by the update, so the row is new exactly when
+# first_seen still equals last_seen.
+_SQL_UPSERT_APP = """
+INSERT INTO apps (
+    platform, app_name, app_url, download_url,
+    logo_url_original, graphic_url_original,
+    source_url, discovery_method, provenance,
+    screenshot_captured_by_us, screenshot_url_cached,
+    first_seen, last_seen, ingestion_run_id
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(platform, app_url) DO UPDATE SET
+    app_name=COALESCE(excluded.app_name, apps.app_name),
+    download_url=COALESCE(excluded.download_url, apps.download_url),
+    logo_url_original=COALESCE(excluded.logo_url_original, apps.logo_url_original),
+    graphic_url_original=COALESCE(excluded.graphic_url_original, apps.graphic_url_original),
+    source_url=excluded.source_url,
+    discovery_method=excluded.discovery_method,
+    provenance=excluded.provenance,
+    screenshot_captured_by_us=MAX(excluded.screenshot_captured_by_us, apps.screenshot_captured_by_us),
+    screenshot_url_cached=COALESCE(excluded.screenshot_url_cached, apps.screenshot_url_cached),
+    last_seen=excluded.last_seen,
+    ingestion_run_id=excluded.ingestion_run_id
+"""
+
+# Batch size for app_url IN (...) lookups; well under SQLite's variable limit
+_LOOKUP_CHUNK = 500
+
+# Write buffer for CSV exports (1 MiB)
+CSV_WRITE_BUFFER = 1 << 20
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_provenance(items: Tuple[Tuple[str, str], ...]) -> str:
+    """Compact JSON for a provenance mapping.
+
+    Only a handful of field/selector combinations occur per platform, so the
+    encoded string is cached keyed on the sorted items.
+    """
+    return json.dumps(dict(items), ensure_ascii=False, separators=(',', ':'))
+
+
 class VibeRegistryDB:
     """Wrapper around SQLite to store apps and runs with provenance."""
 
@@ -80,10 +300,32 @@ class VibeRegistryDB:
         self.db_path = db_path
         # Ensure parent directories exist
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        # Establish connection on demand; row_factory returns dict‑like objects
-        self.conn = sqlite3.connect(self.db_path)
+        # Establish connection on demand; row_factory returns dict‑like objects.
+        # The connection may be shared with worker threads, so writes through
+        # it are serialised with _write_lock.
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self._write_lock = threading.Lock()
+        # WAL lets readers and the writer proceed together and, with
+        # synchronous=NORMAL, only syncs at checkpoints rather than every commit
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB, for export reads
         self._init_schema()
+        # Reused cursors for the hot write statements
+        self._upsert_cur = self.conn.cursor()
+        self._runs_cur = self.conn.cursor()
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """Open a separate read-only connection.
+
+        Under WAL it reads the last committed state without contending with
+        the writer connection.
+        """
+        uri = self.db_path.resolve().as_uri() + '?mode=ro'
+        return sqlite3.connect(uri, uri=True)
 
     def _init_schema(self) -> None:
         """Create tables if they do not already exist."""
@@ -111,6 +353,15 @@ class VibeRegistryDB:
             )
             """
         )
+        # Partial index for the per-run export: only rows still at their first
+        # sighting are indexed, so it stays small.  (platform, app_url) needs
+        # no extra index; the UNIQUE constraint already provides one.
+        cur.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_apps_run_firstseen
+            ON apps(ingestion_run_id) WHERE first_seen = last_seen
+            """
+        )
         # Table to log each run
         cur.execute(
             """
@@ -134,13 +385,10 @@ class VibeRegistryDB:
     def start_run(self) -> int:
         """Insert a new run record and return its ID."""
         now = _dt.datetime.now(_dt.timezone.utc).isoformat()
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO runs (started_at) VALUES (?)",
-            (now,),
-        )
-        self.conn.commit()
-        return cur.lastrowid
+        with self._write_lock:
+            self._runs_cur.execute(_SQL_START_RUN, (now,))
+            self.conn.commit()
+            return self._runs_cur.lastrowid
 
     def finish_run(
         self,
@@ -153,22 +401,64 @@ class VibeRegistryDB:
     ) -> None:
         """Mark a run as finished with summary statistics."""
         finished_at = _dt.datetime.now(_dt.timezone.utc).isoformat()
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            UPDATE runs
-            SET finished_at=?, status=?, new_count=?, updated_count=?, error_count=?, log_excerpt=?
-            WHERE id=?
-            """,
-            (finished_at, status, new_count, updated_count, error_count, log_excerpt, run_id),
-        )
-        self.conn.commit()
+        with self._write_lock:
+            self._runs_cur.execute(
+                _SQL_FINISH_RUN,
+                (finished_at, status, new_count, updated_count, error_count, log_excerpt, run_id),
+            )
+            self.conn.commit()
 
     # ------------------------------------------------------------------
     # App upsert
 
-    def upsert_app(
-        self,
+    def upsert_apps_many(self, apps: List[Dict[str, Any]], seen_at: Optional[str] = None) -> Tuple[int, int]:
+        """Insert or update a batch of apps in one transaction.
+
+        Each dict holds the keyword arguments of :meth:`_app_params` other
+        than ``now``.  The batch is written with a single ``executemany`` and
+        committed.  ``seen_at`` is the ISO timestamp stored as first/last seen;
+        it defaults to the current time.
+
+        Returns a tuple (new_count, updated_count).
+        """
+        if not apps:
+            return 0, 0
+        now = seen_at or _dt.datetime.now(_dt.timezone.utc).isoformat()
+        rows = [self._app_params(now=now, **app) for app in apps]
+        new_count = 0
+        with self._write_lock, self.conn:
+            # executemany can't report per-row results, so work out which
+            # apps already exist before writing.  Repeats within the batch
+            # count as updates after their first occurrence.
+            known = self._existing_app_keys({(app['platform'], app['app_url']) for app in apps})
+            for app in apps:
+                key = (app['platform'], app['app_url'])
+                if key not in known:
+                    new_count += 1
+                    known.add(key)
+            self._upsert_cur.executemany(_SQL_UPSERT_APP, rows)
+        return new_count, len(apps) - new_count
+
+    def _existing_app_keys(self, keys: Iterable[Tuple[str, str]]) -> set:
+        """Return the subset of (platform, app_url) pairs already stored."""
+        by_platform: Dict[str, List[str]] = {}
+        for platform, app_url in keys:
+            by_platform.setdefault(platform, []).append(app_url)
+        found = set()
+        cur = self.conn.cursor()
+        for platform, urls in by_platform.items():
+            for i in range(0, len(urls), _LOOKUP_CHUNK):
+                chunk = urls[i:i + _LOOKUP_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                cur.execute(
+                    f"SELECT app_url FROM apps WHERE platform = ? AND app_url IN ({placeholders})",
+                    (platform, *chunk),
+                )
+                found.update((platform, row[0]) for row in cur)
+        return found
+
+    @staticmethod
+    def _app_params(
         run_id: int,
         platform: str,
         app_name: Optional[str],
@@ -181,87 +471,25 @@ class VibeRegistryDB:
         provenance: Dict[str, str],
         screenshot_captured_by_us: bool,
         screenshot_url_cached: Optional[str],
-    ) -> Tuple[bool, int]:
-        """Insert or update an app record.
-
-        Returns a tuple (is_new, rowid).
-        """
-        now = _dt.datetime.now(_dt.timezone.utc).isoformat()
-        provenance_json = json.dumps(provenance, ensure_ascii=False)
-        cur = self.conn.cursor()
-        # Try to insert; if conflict on (platform, app_url) then update
-        try:
-            cur.execute(
-                """
-                INSERT INTO apps (
-                    platform, app_name, app_url, download_url,
-                    logo_url_original, graphic_url_original,
-                    source_url, discovery_method, provenance,
-                    screenshot_captured_by_us, screenshot_url_cached,
-                    first_seen, last_seen, ingestion_run_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    platform,
-                    app_name,
-                    app_url,
-                    download_url,
-                    logo_url_original,
-                    graphic_url_original,
-                    source_url,
-                    discovery_method,
-                    provenance_json,
-                    int(screenshot_captured_by_us),
-                    screenshot_url_cached,
-                    now,
-                    now,
-                    run_id,
-                ),
-            )
-            self.conn.commit()
-            return True, cur.lastrowid
-        except sqlite3.IntegrityError:
-            # Conflict: update existing record
-            cur.execute(
-                """
-                UPDATE apps
-                SET app_name=COALESCE(?, app_name),
-                    download_url=COALESCE(?, download_url),
-                    logo_url_original=COALESCE(?, logo_url_original),
-                    graphic_url_original=COALESCE(?, graphic_url_original),
-                    source_url=?,
-                    discovery_method=?,
-                    provenance=?,
-                    screenshot_captured_by_us=CASE WHEN ? THEN 1 ELSE screenshot_captured_by_us END,
-                    screenshot_url_cached=COALESCE(?, screenshot_url_cached),
-                    last_seen=?,
-                    ingestion_run_id=?
-                WHERE platform=? AND app_url=?
-                """,
-                (
-                    app_name,
-                    download_url,
-                    logo_url_original,
-                    graphic_url_original,
-                    source_url,
-                    discovery_method,
-                    provenance_json,
-                    int(screenshot_captured_by_us),
-                    screenshot_url_cached,
-                    now,
-                    run_id,
-                    platform,
-                    app_url,
-                ),
-            )
-            self.conn.commit()
-            # Return False because it's an update
-            cur.execute(
-                "SELECT id FROM apps WHERE platform=? AND app_url=?",
-                (platform, app_url),
-            )
-            rowid = cur.fetchone()[0]
-            return False, rowid
+        now: str,
+    ) -> Tuple[Any, ...]:
+        """Build the parameter tuple for the apps UPSERT."""
+        return (
+            platform,
+            app_name,
+            app_url,
+            download_url,
+            logo_url_original,
+            graphic_url_original,
+            source_url,
+            discovery_method,
+            _encode_provenance(tuple(sorted(provenance.items()))),
+            int(screenshot_captured_by_us),
+            screenshot_url_cached,
+            now,
+            now,
+            run_id,
+        )
 
     # ------------------------------------------------------------------
     # Export utilities
@@ -271,56 +499,69 @@ class VibeRegistryDB:
 
         Returns the number of exported rows.
         """
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            SELECT * FROM apps WHERE ingestion_run_id = ? AND first_seen = last_seen
-            """,
-            (run_id,),
-        )
-        rows = cur.fetchall()
-        if not rows:
-            return 0
-        # Ensure directory exists
-        export_path.parent.mkdir(parents=True, exist_ok=True)
-        # Write CSV manually to avoid requiring pandas
-        with open(export_path, 'w', newline='', encoding='utf-8') as f:
-            # header
-            headers = rows[0].keys()
-            f.write(','.join(headers) + '\n')
-            for row in rows:
-                # Escape commas and quotes appropriately
-                values = []
-                for col in headers:
-                    val = row[col]
-                    if val is None:
-                        values.append('')
-                    else:
-                        sval = str(val)
-                        # Surround with quotes if contains comma or quote
-                        if ',' in sval or '"' in sval or '\n' in sval:
-                            sval = '"' + sval.replace('"', '""') + '"'
-                        values.append(sval)
-                f.write(','.join(values) + '\n')
-        return len(rows)
+        with contextlib.closing(self._read_connection()) as conn:
+            cur = conn.cursor()
+            where = "WHERE ingestion_run_id = ? AND first_seen = last_seen"
+            count = cur.execute(f"SELECT count(*) FROM apps {where}", (run_id,)).fetchone()[0]
+            if not count:
+                return 0
+            # Ensure directory exists
+            export_path.parent.mkdir(parents=True, exist_ok=True)
+            # Rows are streamed straight from the cursor rather than loaded with
+            # fetchall(); csv.writer handles quoting in C and writes None as an
+            # empty field
+            cur.arraysize = 1000
+            cur.execute(f"SELECT * FROM apps {where}", (run_id,))
+            with open(export_path, 'w', newline='', encoding='utf-8',
+                      buffering=CSV_WRITE_BUFFER) as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow([col[0] for col in cur.description])
+                writer.writerows(cur)
+        return count
 
 
 # -----------------------------------------------------------------------------
 # Scrapers
 #
 
+async def _block_unused_resources(route: Any) -> None:
+    """Playwright route handler that aborts images, fonts and media."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 class Scraper:
     """Scrapes specific platforms.  Each method returns counts of new/updated/error."""
 
-    def __init__(self, db: VibeRegistryDB, run_id: int, capture_screenshots: bool, verbose: bool = False) -> None:
+    def __init__(
+        self,
+        db: VibeRegistryDB,
+        run_id: int,
+        capture_screenshots: bool,
+        verbose: bool = False,
+        detail_timeout_ms: int = DETAIL_TIMEOUT_MS,
+        meta_wait_timeout_ms: int = META_WAIT_TIMEOUT_MS,
+    ) -> None:
         self.db = db
         self.run_id = run_id
         self.capture_screenshots = capture_screenshots
         self.verbose = verbose
+        self.detail_timeout_ms = detail_timeout_ms
+        self.meta_wait_timeout_ms = meta_wait_timeout_ms
+        # Every app touched in this run is stamped with the run's start time
+        self.run_started_iso = _dt.datetime.now(_dt.timezone.utc).isoformat()
         # Directory for screenshots
         self.screenshot_dir = Path('cache/screenshots')
         if self.capture_screenshots:
             self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        # Screenshot PNGs are written to disk off the event loop, on a pool
+        # that lives for one scrape run
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: List[Tuple[Path, Future]] = []
+        # Per-run sequence number that keeps screenshot filenames unique
+        self._shot_counter = itertools.count()
 
     def _log(self, message: str) -> None:
         """Print message if verbose mode is enabled."""
@@ -334,7 +575,10 @@ class Scraper:
         This implementation paginates through catalog.base44.com/apps and follows
         each app link to a detail page.  It extracts name, canonical app URL and
         og:image for graphic.  It does not infer values beyond trimming
-        whitespace.
+        whitespace.  Detail pages of a listing page are fetched concurrently,
+        over plain HTTP when httpx is installed, otherwise (or for pages that
+        need rendering) on a pool of ``DETAIL_CONCURRENCY`` reused browser
+        tabs.
 
         Parameters
         ----------
@@ -346,258 +590,374 @@ class Scraper:
         -------
         new_count, updated_count, error_count: Tuple[int, int, int]
         """
-        if sync_playwright is None:
+        if async_playwright is None:
             raise RuntimeError(
                 "Playwright is required for scraping.  Please install it with 'pip install playwright' and run 'playwright install'."
             )
-        
+        return asyncio.run(self._scrape_base44_async(max_items))
+
+    async def _scrape_base44_async(self, max_items: Optional[int]) -> Tuple[int, int, int]:
         self._log("Starting Base44 scraper")
         new_count = 0
         updated_count = 0
         error_count = 0
         processed = 0
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='screenshot-io')
+        playwright = None
+        browser = None
+        http = None
+        detail_pages: asyncio.Queue = asyncio.Queue()
         
         try:
-            with sync_playwright() as p:
-                self._log("Launching browser")
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context()
-                page = context.new_page()
-                page_num = 1
+            playwright = await async_playwright().start()
+            self._log("Launching browser")
+            browser = await playwright.chromium.launch(headless=True)
+            context = await browser.new_context()
+            if not self.capture_screenshots:
+                await context.route('**/*', _block_unused_resources)
+            page = await context.new_page()
+            # Fixed pool of detail tabs; the queue also bounds concurrency
+            for _ in range(DETAIL_CONCURRENCY):
+                detail_pages.put_nowait(await context.new_page())
+            http = self._open_http_client()
+            page_num = 1
+            
+            while True:
+                list_url = f'https://catalog.base44.com/apps?page={page_num}'
+                self._log(f"Navigating to page {page_num}: {list_url}")
+                await page.goto(list_url)
                 
-                while True:
-                    list_url = f'https://catalog.base44.com/apps?page={page_num}'
-                    self._log(f"Navigating to page {page_num}: {list_url}")
-                    page.goto(list_url)
-                    
-                    # Wait for page load; if it fails, break
-                    try:
-                        self._log("Waiting for app links to load...")
-                        page.wait_for_selector('a[href^="/apps/"]', timeout=10000)
-                        self._log("App links found!")
-                    except Exception as e:
-                        self._log(f"No app links found on page {page_num}: {e}")
-                        break
-                    
-                    # Collect app detail links; ensure uniqueness
-                    self._log("Collecting app detail links...")
-                    links = page.eval_on_selector_all(
-                        'a[href^="/apps/"]', 'els => els.map(el => el.href)'
-                    )
-                    self._log(f"Found {len(links)} raw links")
-                    
-                    # Remove duplicates and extraneous nav links
-                    unique_links = []
-                    seen = set()
-                    for link in links:
-                        if '/apps/' not in link:
-                            continue
-                        if link in seen:
-                            continue
-                        # Exclude sign up links or login
-                        if 'signup' in link or 'login' in link:
-                            continue
-                        seen.add(link)
-                        unique_links.append(link)
-                    
-                    self._log(f"Filtered to {len(unique_links)} unique app links")
-                    
-                    if not unique_links:
-                        self._log("No valid app links found, stopping pagination")
-                        break
-                    
-                    for i, detail_url in enumerate(unique_links):
-                        if max_items is not None and processed >= max_items:
-                            self._log(f"Reached max_items limit ({max_items}), stopping")
-                            break
-                        
-                        processed += 1
-                        self._log(f"Processing app {i+1}/{len(unique_links)} (total: {processed}): {detail_url}")
-                        
-                        try:
-                            # Use a separate page for each detail to isolate state
-                            detail_page = context.new_page()
-                            self._log(f"  Loading detail page...")
-                            detail_page.goto(detail_url)
-                            
-                            # Wait for meta tags to load; if not found, skip
-                            try:
-                                detail_page.wait_for_selector('head meta[property="og:title"]', timeout=10000)
-                                self._log(f"  Meta tags loaded successfully")
-                            except Exception as e:
-                                self._log(f"  ERROR: Meta tags not found: {e}")
-                                error_count += 1
-                                detail_page.close()
-                                continue
-                            
-                            content = detail_page.content()
-                            soup = BeautifulSoup(content, 'html.parser')
-                            
-                            # Extract fields explicitly
-                            app_name = None
-                            app_url = None
-                            graphic_url_original = None
-                            logo_url_original = None
-                            download_url = None
-                            # provenance dict; keys correspond to db fields
-                            provenance: Dict[str, str] = {}
-                            
-                            # Name: prefer og:title
-                            meta_title = soup.find('meta', property='og:title')
-                            if meta_title and meta_title.get('content'):
-                                app_name = meta_title['content'].strip()
-                                provenance['app_name'] = "meta[property='og:title']"
-                                self._log(f"  Found app name: {app_name}")
-                            else:
-                                self._log(f"  No app name found")
-                            
-                            # Canonical link for app_url
-                            link_canonical = soup.find('link', rel='canonical')
-                            if link_canonical and link_canonical.get('href'):
-                                app_url = link_canonical['href'].strip()
-                                provenance['app_url'] = "link[rel='canonical']"
-                                self._log(f"  Found canonical URL: {app_url}")
-                            else:
-                                self._log(f"  No canonical URL found")
-                            
-                            # Download link: we look for anchor starting with 'Try '
-                            try_link = soup.find('a', string=lambda x: x and x.lower().startswith('try '))
-                            if try_link and try_link.get('href'):
-                                download_url_candidate = try_link['href'].strip()
-                                # Accept only if absolute URL
-                                if download_url_candidate.startswith('http'):
-                                    download_url = download_url_candidate
-                                    provenance['download_url'] = "a[text^='Try ']"
-                                    self._log(f"  Found download URL: {download_url}")
-                                else:
-                                    self._log(f"  Found relative download URL (ignored): {download_url_candidate}")
-                            else:
-                                self._log(f"  No download URL found")
-                            
-                            # Graphic: og:image
-                            meta_image = soup.find('meta', property='og:image')
-                            if meta_image and meta_image.get('content'):
-                                graphic_url_original = meta_image['content'].strip()
-                                provenance['graphic_url_original'] = "meta[property='og:image']"
-                                self._log(f"  Found graphic URL: {graphic_url_original}")
-                            else:
-                                self._log(f"  No graphic URL found")
-                            
-                            # Logo: look for apple-touch-icon or shortcut icon that isn't default
-                            link_logo = soup.find('link', rel=lambda x: x and 'apple-touch-icon' in x)
-                            if link_logo and link_logo.get('href'):
-                                logo_candidate = link_logo['href'].strip()
-                                if logo_candidate.startswith('http'):
-                                    logo_url_original = logo_candidate
-                                    provenance['logo_url_original'] = "link[rel*='apple-touch-icon']"
-                                    self._log(f"  Found logo URL: {logo_url_original}")
-                                else:
-                                    self._log(f"  Found relative logo URL (ignored): {logo_candidate}")
-                            else:
-                                self._log(f"  No logo URL found")
-                            
-                            # If we didn't get a canonical app_url but have a download_url, fall back
-                            if not app_url and download_url:
-                                app_url = download_url
-                                provenance['app_url'] = provenance.get('download_url', 'download_url')
-                                self._log(f"  Using download URL as app URL: {app_url}")
-                            
-                            # Only proceed if we have a platform and app_url
-                            if not app_url:
-                                self._log(f"  ERROR: No app URL found, skipping")
-                                error_count += 1
-                                detail_page.close()
-                                continue
-                            
-                            # Screenshot capturing: only if requested and missing graphic
-                            screenshot_captured = False
-                            screenshot_cached_path = None
-                            if self.capture_screenshots and not graphic_url_original:
-                                self._log(f"  Capturing screenshot (no graphic found)...")
-                                # Use Playwright's screenshot to capture visible page
-                                # Save as PNG under cache/screenshots with timestamp and slug
-                                slug = os.path.basename(detail_url.rstrip('/'))
-                                filename = f"{slug}_{int(_dt.datetime.now().timestamp())}.png"
-                                screenshot_path = self.screenshot_dir / filename
-                                try:
-                                    detail_page.screenshot(path=str(screenshot_path), full_page=True)
-                                    screenshot_captured = True
-                                    screenshot_cached_path = str(screenshot_path)
-                                    self._log(f"  Screenshot saved: {screenshot_path}")
-                                except Exception as e:
-                                    # If screenshot fails we ignore and don't set
-                                    screenshot_captured = False
-                                    screenshot_cached_path = None
-                                    self._log(f"  Screenshot failed: {e}")
-                            
-                            # Insert or update in DB
-                            self._log(f"  Saving to database...")
-                            is_new, _ = self.db.upsert_app(
-                                run_id=self.run_id,
-                                platform='Base44',
-                                app_name=app_name,
-                                app_url=app_url,
-                                download_url=download_url,
-                                logo_url_original=logo_url_original,
-                                graphic_url_original=graphic_url_original,
-                                source_url=detail_url,
-                                discovery_method='showcase',
-                                provenance=provenance,
-                                screenshot_captured_by_us=screenshot_captured,
-                                screenshot_url_cached=screenshot_cached_path,
-                            )
-                            if is_new:
-                                new_count += 1
-                                self._log(f"  ✓ NEW app saved")
-                            else:
-                                updated_count += 1
-                                self._log(f"  ✓ Updated existing app")
-                            detail_page.close()
-                        except Exception as e:
-                            self._log(f"  ERROR processing {detail_url}: {e}")
-                            error_count += 1
-                            # Ensure page closed on error
-                            with contextlib.suppress(Exception):
-                                detail_page.close()
-                    
-                    # Stop if reached max_items
-                    if max_items is not None and processed >= max_items:
-                        break
-                    
-                    # Determine if there is a "Next" button; if not, break
-                    # Using Playwright to evaluate existence
-                    has_next = False
-                    try:
-                        # Some Next buttons have rel="next", some have text 'Next'
-                        next_selector = page.query_selector("a[rel='next']")
+                # Wait for page load; if it fails, break
+                try:
+                    self._log("Waiting for app links to load...")
+                    await page.wait_for_selector('a[href^="/apps/"]', timeout=10000)
+                    self._log("App links found!")
+                except Exception as e:
+                    self._log(f"No app links found on page {page_num}: {e}")
+                    break
+                
+                # Collect unique app detail links, deduplicated and
+                # filtered in the page
+                self._log("Collecting app detail links...")
+                unique_links = await page.evaluate(BASE44_LISTING_LINKS_JS)
+                self._log(f"Found {len(unique_links)} unique app links")
+                
+                if not unique_links:
+                    self._log("No valid app links found, stopping pagination")
+                    break
+                
+                if max_items is not None and processed + len(unique_links) > max_items:
+                    unique_links = unique_links[:max_items - processed]
+                    self._log(f"Reached max_items limit ({max_items}), processing {len(unique_links)} more")
+                processed += len(unique_links)
+                
+                results = await asyncio.gather(
+                    *(self._process_detail(context, detail_pages, http, url) for url in unique_links),
+                    return_exceptions=True,
+                )
+                records = []
+                for detail_url, result in zip(unique_links, results):
+                    if isinstance(result, BaseException):
+                        self._log(f"  ERROR processing {detail_url}: {result}")
+                        error_count += 1
+                    elif result is None:
+                        error_count += 1
+                    else:
+                        records.append(result)
+                
+                # One executemany and one commit per listing page
+                self._log(f"Saving {len(records)} apps from page {page_num} to database...")
+                page_new, page_updated = self.db.upsert_apps_many(records, seen_at=self.run_started_iso)
+                self._log(f"  ✓ {page_new} new, {page_updated} updated")
+                new_count += page_new
+                updated_count += page_updated
+                
+                # Stop if reached max_items
+                if max_items is not None and processed >= max_items:
+                    break
+                
+                # Determine if there is a "Next" button; if not, break
+                # Using Playwright to evaluate existence
+                has_next = False
+                try:
+                    # Some Next buttons have rel="next", some have text 'Next'
+                    next_selector = await page.query_selector("a[rel='next']")
+                    if next_selector:
+                        has_next = True
+                        self._log(f"Found 'Next' button (rel='next')")
+                    else:
+                        next_selector = await page.query_selector("a:has-text('Next')")
                         if next_selector:
                             has_next = True
-                            self._log(f"Found 'Next' button (rel='next')")
-                        else:
-                            next_selector = page.query_selector("a:has-text('Next')")
-                            if next_selector:
-                                has_next = True
-                                self._log(f"Found 'Next' button (text='Next')")
-                    except Exception as e:
-                        self._log(f"Error checking for Next button: {e}")
-                        pass
-                    
-                    if not has_next:
-                        self._log(f"No 'Next' button found, pagination complete")
-                        break
-                    
-                    page_num += 1
-                    
-                self._log("Closing browser")
-                browser.close()
+                            self._log(f"Found 'Next' button (text='Next')")
+                except Exception as e:
+                    self._log(f"Error checking for Next button: {e}")
+                    pass
+                
+                if not has_next:
+                    self._log(f"No 'Next' button found, pagination complete")
+                    break
+                
+                page_num += 1
                 
         except Exception as e:
             self._log(f"FATAL ERROR in Base44 scraper: {e}")
             error_count += 1
+        finally:
+            # Queued screenshot writes are awaited and the client, tabs and
+            # browser released even if the scrape failed
+            error_count += await self._flush_screenshot_writes()
+            self._io_pool.shutdown()
+            self._io_pool = None
+            if http is not None:
+                with contextlib.suppress(Exception):
+                    await http.aclose()
+            self._log("Closing browser")
+            while not detail_pages.empty():
+                with contextlib.suppress(Exception):
+                    await detail_pages.get_nowait().close()
+            if browser is not None:
+                with contextlib.suppress(Exception):
+                    await browser.close()
+            if playwright is not None:
+                with contextlib.suppress(Exception):
+                    await playwright.stop()
         
         self._log(f"Base44 scraping complete: {new_count} new, {updated_count} updated, {error_count} errors")
         return new_count, updated_count, error_count
 
+    async def _flush_screenshot_writes(self) -> int:
+        """Wait for queued screenshot files to reach disk.
+
+        Returns the number of writes that failed.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        failed = 0
+        for path, future in pending:
+            try:
+                await asyncio.wrap_future(future)
+            except Exception as e:
+                self._log(f"Writing screenshot {path} failed: {e}")
+                failed += 1
+        return failed
+
+    def _open_http_client(self) -> Any:
+        """Return an HTTP client for detail pages, or None to use the browser only."""
+        if httpx is None or lxml_html is None:
+            return None
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            # pool=None: requests queue for a connection instead of timing out
+            timeout=httpx.Timeout(10.0, pool=None),
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS),
+        )
+
+    async def _process_detail(self, context: Any, pages: asyncio.Queue, http: Any, detail_url: str) -> Optional[Dict[str, Any]]:
+        """Fetch one Base44 detail page and build its app record.
+
+        The static HTML is tried first over plain HTTP; a pooled browser tab
+        is only used when og:title is missing from it (client-rendered page)
+        or a screenshot has to be taken.
+
+        Returns one app record for :meth:`VibeRegistryDB.upsert_apps_many`,
+        or None when the page was skipped.
+        """
+        self._log(f"Processing app: {detail_url}")
+        if http is not None:
+            meta = await self._fetch_detail_http(http, detail_url)
+            if meta is not None:
+                extracted = self._base44_fields(meta)
+                if extracted is None:
+                    return None
+                fields, provenance = extracted
+                if not (self.capture_screenshots and not fields['graphic_url_original']):
+                    return self._base44_record(detail_url, fields, provenance, None)
+                self._log(f"  Screenshot needed, loading in browser...")
+        return await self._process_detail_browser(context, pages, detail_url)
+
+    async def _fetch_detail_http(self, http: Any, detail_url: str) -> Optional[Dict[str, Optional[str]]]:
+        """Fetch and parse a detail page without a browser.
+
+        Returns None if the request fails or the HTML carries no og:title.
+        """
+        try:
+            response = await http.get(detail_url)
+            response.raise_for_status()
+        except Exception as e:
+            self._log(f"  HTTP fetch failed, falling back to browser: {e}")
+            return None
+        meta = parse_base44_detail(response.text)
+        if not meta['app_name']:
+            self._log(f"  No og:title in static HTML, falling back to browser")
+            return None
+        return meta
+
+    async def _process_detail_browser(self, context: Any, pages: asyncio.Queue, detail_url: str) -> Optional[Dict[str, Any]]:
+        """Render a detail page on a pooled tab and build its app record."""
+        detail_page = await pages.get()
+        try:
+            try:
+                self._log(f"  Loading detail page...")
+                await detail_page.goto(detail_url, wait_until='domcontentloaded', timeout=self.detail_timeout_ms)
+                
+                # Wait for meta tags to load; if not found, skip
+                try:
+                    await detail_page.wait_for_selector(
+                        'head meta[property="og:title"]', state='attached', timeout=self.meta_wait_timeout_ms
+                    )
+                    self._log(f"  Meta tags loaded successfully")
+                except Exception as e:
+                    self._log(f"  ERROR: Meta tags not found: {e}")
+                    return None
+                
+                raw_meta = await detail_page.evaluate(BASE44_DETAIL_JS)
+                meta = {key: (value or '').strip() or None for key, value in raw_meta.items()}
+                extracted = self._base44_fields(meta)
+                if extracted is None:
+                    return None
+                fields, provenance = extracted
+                
+                # Screenshot capturing: only if requested and missing graphic
+                screenshot_cached_path = None
+                if self.capture_screenshots and not fields['graphic_url_original']:
+                    self._log(f"  Capturing screenshot (no graphic found)...")
+                    # Use Playwright's screenshot to capture visible page
+                    # Save as PNG under cache/screenshots with slug, run ID and sequence number
+                    slug = os.path.basename(detail_url.rstrip('/'))
+                    filename = f"{slug}_{self.run_id}_{next(self._shot_counter):05d}.png"
+                    screenshot_path = self.screenshot_dir / filename
+                    try:
+                        png = await detail_page.screenshot(full_page=True)
+                        self._pending_writes.append(
+                            (screenshot_path, self._io_pool.submit(screenshot_path.write_bytes, png))
+                        )
+                        screenshot_cached_path = str(screenshot_path)
+                        self._log(f"  Screenshot queued: {screenshot_path}")
+                    except Exception as e:
+                        # If screenshot fails we ignore and don't set
+                        screenshot_cached_path = None
+                        self._log(f"  Screenshot failed: {e}")
+                
+                return self._base44_record(detail_url, fields, provenance, screenshot_cached_path)
+            finally:
+                # Blank the tab rather than closing it so the next URL reuses
+                # it; replace it if it has died
+                try:
+                    await detail_page.goto('about:blank')
+                except Exception:
+                    with contextlib.suppress(Exception):
+                        await detail_page.close()
+                    detail_page = await context.new_page()
+        finally:
+            pages.put_nowait(detail_page)
+
+    def _base44_fields(self, meta: Dict[str, Optional[str]]) -> Optional[Tuple[Dict[str, Optional[str]], Dict[str, str]]]:
+        """Validate extracted metadata and record where each field came from.
+
+        Returns (fields, provenance), or None if no app URL could be found.
+        """
+        # Extract fields explicitly
+        app_name = None
+        app_url = None
+        graphic_url_original = None
+        logo_url_original = None
+        download_url = None
+        # provenance dict; keys correspond to db fields
+        provenance: Dict[str, str] = {}
+        
+        # Name: prefer og:title
+        if meta['app_name']:
+            app_name = meta['app_name']
+            provenance['app_name'] = "meta[property='og:title']"
+            self._log(f"  Found app name: {app_name}")
+        else:
+            self._log(f"  No app name found")
+        
+        # Canonical link for app_url
+        if meta['app_url']:
+            app_url = meta['app_url']
+            provenance['app_url'] = "link[rel='canonical']"
+            self._log(f"  Found canonical URL: {app_url}")
+        else:
+            self._log(f"  No canonical URL found")
+        
+        # Download link: we look for anchor starting with 'Try '
+        download_url_candidate = meta['download_url']
+        if download_url_candidate:
+            # Accept only if absolute URL
+            if download_url_candidate.startswith('http'):
+                download_url = download_url_candidate
+                provenance['download_url'] = "a[text^='Try ']"
+                self._log(f"  Found download URL: {download_url}")
+            else:
+                self._log(f"  Found relative download URL (ignored): {download_url_candidate}")
+        else:
+            self._log(f"  No download URL found")
+        
+        # Graphic: og:image
+        if meta['graphic_url_original']:
+            graphic_url_original = meta['graphic_url_original']
+            provenance['graphic_url_original'] = "meta[property='og:image']"
+            self._log(f"  Found graphic URL: {graphic_url_original}")
+        else:
+            self._log(f"  No graphic URL found")
+        
+        # Logo: look for apple-touch-icon or shortcut icon that isn't default
+        logo_candidate = meta['logo_url_original']
+        if logo_candidate:
+            if logo_candidate.startswith('http'):
+                logo_url_original = logo_candidate
+                provenance['logo_url_original'] = "link[rel*='apple-touch-icon']"
+                self._log(f"  Found logo URL: {logo_url_original}")
+            else:
+                self._log(f"  Found relative logo URL (ignored): {logo_candidate}")
+        else:
+            self._log(f"  No logo URL found")
+        
+        # If we didn't get a canonical app_url but have a download_url, fall back
+        if not app_url and download_url:
+            app_url = download_url
+            provenance['app_url'] = provenance.get('download_url', 'download_url')
+            self._log(f"  Using download URL as app URL: {app_url}")
+        
+        # Only proceed if we have a platform and app_url
+        if not app_url:
+            self._log(f"  ERROR: No app URL found, skipping")
+            return None
+        
+        fields = {
+            'app_name': app_name,
+            'app_url': app_url,
+            'download_url': download_url,
+            'logo_url_original': logo_url_original,
+            'graphic_url_original': graphic_url_original,
+        }
+        return fields, provenance
+
+    def _base44_record(
+        self,
+        detail_url: str,
+        fields: Dict[str, Optional[str]],
+        provenance: Dict[str, str],
+        screenshot_cached_path: Optional[str],
+    ) -> Dict[str, Any]:
+        """Assemble the upsert arguments for a validated Base44 app."""
+        return dict(
+            run_id=self.run_id,
+            platform='Base44',
+            app_name=fields['app_name'],
+            app_url=fields['app_url'],
+            download_url=fields['download_url'],
+            logo_url_original=fields['logo_url_original'],
+            graphic_url_original=fields['graphic_url_original'],
+            source_url=detail_url,
+            discovery_method='showcase',
+            provenance=provenance,
+            screenshot_captured_by_us=screenshot_cached_path is not None,
+            screenshot_url_cached=screenshot_cached_path,
+        )
+
     # Placeholder scrapers for other platforms.  These methods simply log that
     # scraping is not yet implemented and return zero counts.
     def scrape_bolt(self, max_items: Optional[int] = None) -> Tuple[int, int, int]:
@@ -621,6 +981,24 @@ class Scraper:
 # CLI
 #
 
+# Longest log excerpt stored on a run row
+LOG_EXCERPT_CHARS = 1000
+
+
+def _log_excerpt(lines: Iterable[str], limit: int = LOG_EXCERPT_CHARS) -> str:
+    """Return ``'\\n'.join(lines)[:limit]`` without joining lines past the limit."""
+    buf = io.StringIO()
+    remaining = limit
+    for i, line in enumerate(lines):
+        piece = line if i == 0 else '\n' + line
+        if len(piece) >= remaining:
+            buf.write(piece[:remaining])
+            break
+        buf.write(piece)
+        remaining -= len(piece)
+    return buf.getvalue()
+
+
 def prompt_platforms() -> List[str]:
     """Interactively ask the user to select platforms."""
     platforms = ['Base44', 'Bolt', 'Replit', 'Lovable', 'Embeddable']
@@ -674,6 +1052,8 @@ def main() -> None:
             platforms = [p.capitalize() for p in args.platforms]
         else:
             platforms = prompt_platforms()
+        # Each platform runs once; duplicates would share one Scraper's state
+        platforms = list(dict.fromkeys(platforms))
         if not platforms:
             print("No platforms selected.  Exiting.")
             return
@@ -683,27 +1063,32 @@ def main() -> None:
         total_errors = 0
         logs: List[str] = []
         scraper = Scraper(db, run_id, capture_screenshots=args.capture_screenshots, verbose=args.verbose)
-        for platform in platforms:
-            print(f"Scraping {platform}…")
-            if platform == 'Base44':
-                new_count, updated_count, error_count = scraper.scrape_base44(max_items=args.max_items)
-            elif platform == 'Bolt':
-                new_count, updated_count, error_count = scraper.scrape_bolt(max_items=args.max_items)
-            elif platform == 'Replit':
-                new_count, updated_count, error_count = scraper.scrape_replit(max_items=args.max_items)
-            elif platform == 'Lovable':
-                new_count, updated_count, error_count = scraper.scrape_lovable(max_items=args.max_items)
-            elif platform == 'Embeddable':
-                new_count, updated_count, error_count = scraper.scrape_embeddable(max_items=args.max_items)
-            else:
-                print(f"Unknown platform: {platform}")
-                continue
+        dispatch = {
+            'Base44': scraper.scrape_base44,
+            'Bolt': scraper.scrape_bolt,
+            'Replit': scraper.scrape_replit,
+            'Lovable': scraper.scrape_lovable,
+            'Embeddable': scraper.scrape_embeddable,
+        }
+        # Platforms are independent and I/O bound, so they are scraped in
+        # parallel threads; results are tallied in the order selected
+        submitted: List[Tuple[str, Future]] = []
+        with ThreadPoolExecutor(max_workers=len(dispatch)) as pool:
+            for platform in platforms:
+                scrape = dispatch.get(platform)
+                if scrape is None:
+                    print(f"Unknown platform: {platform}")
+                    continue
+                print(f"Scraping {platform}…")
+                submitted.append((platform, pool.submit(scrape, max_items=args.max_items)))
+        for platform, future in submitted:
+            new_count, updated_count, error_count = future.result()
             logs.append(f"{platform}: {new_count} new, {updated_count} updated, {error_count} errors")
             total_new += new_count
             total_updated += updated_count
             total_errors += error_count
         # Create log excerpt
-        log_excerpt = '\n'.join(logs)[:1000]  # limit to 1000 chars
+        log_excerpt = _log_excerpt(logs)
         status = 'partial' if total_errors > 0 else 'success'
         db.finish_run(run_id, status, total_new, total_updated, total_errors, log_excerpt)
         print(f"Run {run_id} finished.  New: {total_new}, Updated: {total_updated}, Errors: {total_errors}.")
@@ -4,18 +4,21 @@ Weekly scraper orchestrator - runs all scrapers and generates new items reports
 """
 
 import asyncio
-import json
-import time
+import io
+import orjson
 import logging
+import os
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import traceback
+from dataclasses import asdict, is_dataclass
 
 # Import our scrapers
 from lovable_scraper_final import LovableScraperFinal
 from base44_scraper import Base44Scraper
 from replit_scraper import ReplitGalleryScraper
+from browser_pool import BrowserPool
 from bolt_scraper import BoltGalleryScraper
 from database import ScrapingDatabase
 from notifications import NotificationManager
@@ -31,6 +34,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single site's scrape, in seconds
+SCRAPER_TIMEOUT = 30 * 60
+# How many site scrapers may run at the same time
+MAX_CONCURRENT_SCRAPERS = 4
+# Write buffer for the per-site JSON archives
+JSON_WRITE_BUFFER = 1 << 20
+# How long a site's scraped items may be reused by a re-run, in seconds.  Off
+# by default: weekly runs always scrape; set SCRAPE_CACHE_TTL to let a manual
+# re-run (e.g. after another site failed) skip sites scraped moments ago
+SCRAPE_CACHE_TTL = int(os.environ.get('SCRAPE_CACHE_TTL', '0'))
+
+def _write_json_blocking(path: Path, payload: Dict[str, Any]) -> None:
+    """Write payload to path as compact JSON in one buffered write"""
+    with open(path, 'wb', buffering=JSON_WRITE_BUFFER) as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+
 class WeeklyScraper:
     def __init__(self, data_dir: str = "weekly_scraping_data"):
         self.data_dir = Path(data_dir)
@@ -39,6 +58,10 @@ class WeeklyScraper:
         self.db = ScrapingDatabase(str(self.data_dir / "scraping_history.db"))
         self.notification_manager = NotificationManager()
         
+        # Every scraped item is already kept in the database, so the weekly
+        # all-items JSON dump is opt-in (ARCHIVE_FULL_JSON=1)
+        self.archive_full = os.environ.get('ARCHIVE_FULL_JSON', '0') == '1'
+        
         # Configure scrapers
         self.scrapers = {
             "lovable": {
@@ -72,52 +95,85 @@ class WeeklyScraper:
         logger.info(f"Starting {site_name} scraper...")
         
         try:
-            # Initialize and run scraper
-            scraper = scraper_class()
-            
-            if hasattr(scraper, 'scrape_all_apps'):
-                await scraper.scrape_all_apps()
-                items = scraper.apps_data if hasattr(scraper, 'apps_data') else scraper.all_apps
-            elif hasattr(scraper, 'scrape_all_projects'):
-                await scraper.scrape_all_projects()
-                items = scraper.projects_data
+            # Reuse a recent scrape of this site instead of re-downloading it
+            ttl = scraper_config.get("cache_ttl", SCRAPE_CACHE_TTL)
+            items = self.db.get_cached_items(scraper_config["url"]) if ttl > 0 else None
+            cached = items is not None
+            if cached:
+                logger.info(f"{site_name}: Using {len(items)} cached items")
             else:
-                logger.error(f"Unknown scraper interface for {site_name}")
-                return {"success": False, "error": "Unknown scraper interface"}
+                # Initialize and run scraper; every site gets its own context in
+                # the one shared browser instead of launching its own Chromium
+                scraper = scraper_class()
+                browser = await BrowserPool.get_browser()
+                
+                if hasattr(scraper, 'scrape_all_apps'):
+                    await scraper.scrape_all_apps(browser=browser)
+                    items = scraper.apps_data if hasattr(scraper, 'apps_data') else scraper.all_apps
+                elif hasattr(scraper, 'scrape_all_projects'):
+                    await scraper.scrape_all_projects(browser=browser)
+                    # Replit keeps slotted Project dataclasses; everything downstream works on dicts
+                    items = [asdict(p) if is_dataclass(p) else p for p in scraper.projects_data]
+                else:
+                    logger.error(f"Unknown scraper interface for {site_name}")
+                    return {"success": False, "error": "Unknown scraper interface"}
+                
+                if ttl > 0 and not self.db.cache_items(scraper_config["url"], items, ttl):
+                    logger.info(f"{site_name}: Content unchanged since last scrape")
             
             logger.info(f"{site_name}: Found {len(items)} total items")
             
-            # Find new items
-            new_items = self.db.find_new_items(site_name, items)
+            if cached:
+                # The scrape that filled the cache already saved these items and
+                # recorded its run, so only look them up
+                new_items = self.db.find_new_items(site_name, items)
+                stats = {
+                    'total_items': len(items),
+                    'new_items': len(new_items),
+                    'updated_items': 0
+                }
+            else:
+                # Find new items and save all results to database in one transaction
+                new_items, stats = self.db.find_and_save_new(site_name, items)
             logger.info(f"{site_name}: {len(new_items)} new items since last run")
             
-            # Save all results to database
-            stats = self.db.save_scraping_results(site_name, items)
-            
             # Save weekly results
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # One clock read for both file names and both payloads
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            scrape_timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
             
-            # Save all items
-            all_items_file = self.data_dir / f"{scraper_key}_all_{timestamp}.json"
-            with open(all_items_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'scrape_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            # Per-site archives are machine-read, so they are written as
+            # compact UTF-8 JSON; serializing and writing happen in worker
+            # threads so the other scrapers keep running meanwhile
+            loop = asyncio.get_running_loop()
+            files = {}
+            writes = []
+            
+            # Save all items (only when full archives are enabled)
+            if self.archive_full:
+                all_items_file = self.data_dir / f"{scraper_key}_all_{timestamp}.json"
+                writes.append(loop.run_in_executor(None, _write_json_blocking, all_items_file, {
+                    'scrape_timestamp': scrape_timestamp,
                     'site': site_name,
                     'url': scraper_config["url"],
                     'total_items': len(items),
                     'items': items
-                }, f, indent=2, ensure_ascii=False)
+                }))
+                files["all_items"] = str(all_items_file)
             
             # Save new items
             new_items_file = self.data_dir / f"{scraper_key}_new_{timestamp}.json"
-            with open(new_items_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'scrape_timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                    'site': site_name,
-                    'url': scraper_config["url"],
-                    'new_items_count': len(new_items),
-                    'new_items': new_items
-                }, f, indent=2, ensure_ascii=False)
+            writes.append(loop.run_in_executor(None, _write_json_blocking, new_items_file, {
+                'scrape_timestamp': scrape_timestamp,
+                'site': site_name,
+                'url': scraper_config["url"],
+                'new_items_count': len(new_items),
+                'new_items': new_items
+            }))
+            files["new_items"] = str(new_items_file)
+            
+            await asyncio.gather(*writes)
             
             return {
                 "success": True,
@@ -125,10 +181,8 @@ class WeeklyScraper:
                 "total_items": len(items),
                 "new_items": len(new_items),
                 "stats": stats,
-                "files": {
-                    "all_items": str(all_items_file),
-                    "new_items": str(new_items_file)
-                }
+                "cached": cached,
+                "files": files
             }
             
         except Exception as e:
@@ -145,37 +199,69 @@ class WeeklyScraper:
                 "error": str(e)
             }
     
+    async def _run_bounded(self, scraper_key: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Run a single scraper under the concurrency cap and timeout"""
+        async with semaphore:
+            return await asyncio.wait_for(self.run_single_scraper(scraper_key), timeout=SCRAPER_TIMEOUT)
+    
+    def _failure_result(self, scraper_key: str, exc: BaseException) -> Dict[str, Any]:
+        """Turn an exception that escaped run_single_scraper into a failed result"""
+        site_name = self.scrapers[scraper_key]["name"]
+        if isinstance(exc, asyncio.TimeoutError):
+            error = f"Timed out after {SCRAPER_TIMEOUT}s"
+        else:
+            error = str(exc) or type(exc).__name__
+        logger.error(f"Error scraping {site_name}: {error}")
+        self.notification_manager.notify_error(error, f"{site_name} scraper")
+        return {
+            "success": False,
+            "site": site_name,
+            "error": error
+        }
+    
     async def run_all_scrapers(self) -> Dict[str, Any]:
         """Run all scrapers and generate reports"""
         logger.info("Starting weekly scraping run...")
-        start_time = time.time()
+        started = datetime.now()
         
         results = {}
         total_new_items = 0
         
-        # Run each scraper
-        for scraper_key in self.scrapers.keys():
-            result = await self.run_single_scraper(scraper_key)
+        # Run the scrapers concurrently; they are I/O bound
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPERS)
+        keys = list(self.scrapers)
+        gathered = await asyncio.gather(
+            *(self._run_bounded(key, semaphore) for key in keys),
+            return_exceptions=True
+        )
+        
+        for scraper_key, result in zip(keys, gathered):
+            if isinstance(result, BaseException):
+                result = self._failure_result(scraper_key, result)
             results[scraper_key] = result
             
             if result["success"]:
                 total_new_items += result["new_items"]
         
         # Generate summary report
-        end_time = time.time()
-        duration = end_time - start_time
+        finished = datetime.now()
+        duration = (finished - started).total_seconds()
         
         summary = {
-            "run_timestamp": datetime.now().isoformat(),
+            "run_timestamp": finished.isoformat(),
             "duration_seconds": duration,
             "total_new_items": total_new_items,
             "scrapers": results
         }
         
-        # Save summary
-        summary_file = self.data_dir / f"weekly_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        # Save summary to the history database (one commit, no extra file),
+        # serialized once here
+        self.db.save_run_summary(
+            summary,
+            started.isoformat(),
+            summary["run_timestamp"],
+            summary_json=orjson.dumps(summary, option=orjson.OPT_NON_STR_KEYS).decode()
+        )
         
         logger.info(f"Weekly scraping completed in {duration:.1f}s. Total new items: {total_new_items}")
         
@@ -184,65 +270,71 @@ class WeeklyScraper:
         
         return summary
     
-    def generate_weekly_report(self, days: int = 7) -> str:
+    def generate_weekly_report(self, days: int = 7, generated_at: Optional[datetime] = None) -> str:
         """Generate a human-readable weekly report"""
-        report_lines = []
-        report_lines.append("📊 WEEKLY SCRAPING REPORT")
-        report_lines.append("=" * 50)
-        report_lines.append(f"Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append(f"Covering last {days} days")
-        report_lines.append("")
+        generated_at = generated_at or datetime.now()
+        buf = io.StringIO()
+        w = buf.write
+        w("📊 WEEKLY SCRAPING REPORT\n")
+        w("=" * 50 + "\n")
+        w(f"Report generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w(f"Covering last {days} days\n")
+        w("\n")
         
         # Get stats from database
         stats = self.db.get_stats()
         
-        report_lines.append("🌐 SITES SUMMARY:")
+        w("🌐 SITES SUMMARY:\n")
         total_new = 0
         for site in stats["sites"]:
-            report_lines.append(f"  • {site['name']}")
-            report_lines.append(f"    - Total items tracked: {site['tracked_items']}")
-            report_lines.append(f"    - New this week: {site['new_this_week']}")
-            report_lines.append(f"    - Last scraped: {site['last_scraped'] or 'Never'}")
-            report_lines.append("")
+            w(f"  • {site['name']}\n")
+            w(f"    - Total items tracked: {site['tracked_items']}\n")
+            w(f"    - New this week: {site['new_this_week']}\n")
+            w(f"    - Last scraped: {site['last_scraped'] or 'Never'}\n")
+            w("\n")
             total_new += site['new_this_week']
         
-        report_lines.append(f"🎯 TOTAL NEW ITEMS THIS WEEK: {total_new}")
-        report_lines.append("")
+        w(f"🎯 TOTAL NEW ITEMS THIS WEEK: {total_new}\n")
+        w("\n")
+        
+        last_run = stats["last_weekly_run"]
+        if last_run:
+            w("🕒 LAST WEEKLY RUN:\n")
+            w(f"  • Finished: {last_run['finished']} ({last_run['duration_seconds']:.1f}s)\n")
+            w(f"    New: {last_run['total_new']}, Failed scrapers: {last_run['failed_scrapers']}\n")
+            w("\n")
         
-        report_lines.append("📈 RECENT SCRAPING RUNS:")
-        for run in stats["recent_runs"][:5]:
-            report_lines.append(f"  • {run['site']} - {run['timestamp']}")
-            report_lines.append(f"    Found: {run['items_found']}, New: {run['new_items']}")
+        w("📈 RECENT SCRAPING RUNS:\n")
+        for recent in stats["recent_runs"][:5]:
+            w(f"  • {recent['site']} - {recent['timestamp']}\n")
+            w(f"    Found: {recent['items_found']}, New: {recent['new_items']}\n")
         
-        report_lines.append("")
-        report_lines.append("📁 Data files are saved in: " + str(self.data_dir))
+        w("\n")
+        w("📁 Data files are saved in: " + str(self.data_dir))
         
-        return "\n".join(report_lines)
+        return buf.getvalue()
     
     def get_new_items_by_site(self, days: int = 7) -> Dict[str, List[Dict[str, Any]]]:
         """Get new items organized by site"""
-        new_items_by_site = {}
-        
-        for scraper_key, config in self.scrapers.items():
-            site_name = config["name"]
-            new_items = self.db.get_new_items_since(site_name, days)
-            if new_items:
-                new_items_by_site[site_name] = new_items
-        
-        return new_items_by_site
+        site_names = [config["name"] for config in self.scrapers.values()]
+        return self.db.get_new_items_by_site(site_names, days)
 
 async def main():
     """Main function for running weekly scraper"""
     scraper = WeeklyScraper()
     
     # Run all scrapers
-    results = await scraper.run_all_scrapers()
+    try:
+        await scraper.run_all_scrapers()
+    finally:
+        await BrowserPool.close()
     
     # Generate and save report
-    report = scraper.generate_weekly_report()
+    now = datetime.now()
+    report = scraper.generate_weekly_report(generated_at=now)
     
     # Save report to file
-    report_file = scraper.data_dir / f"weekly_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    report_file = scraper.data_dir / f"weekly_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write(report)
     
@@ -265,4 +357,5 @@ async def main():
                 print(f"  ... and {len(items) - 5} more")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    from event_loop import run
+    run(main())
\ No newline at end of file